@@ -1,9 +1,21 @@
 import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext
+from tkinter import ttk, messagebox, scrolledtext, filedialog
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+import queue
 import threading
-import time
+
+from renderer import BarRenderer
+from rekaman import FASE_OUTPUT, TracePlayer, rekam_trace, simpan_trace
+
+# Log hanya menyimpan baris terbaru; langkah lama bisa dilihat lagi lewat slider
+MAKS_BARIS_LOG = 500
+# Interval main loop mengambil event dari worker (ms), ~60 kali per detik
+INTERVAL_UI_MS = 16
+# Engine memakai int64; nilai di luar rentang ini ditolak sebelum worker dimulai
+BATAS_INT64 = 2 ** 63
+# Interval worker memeriksa ulang stop_event saat menunggu tombol Next (detik)
+INTERVAL_CEK_STOP = 0.05
 
 
 class CountingSort:
@@ -15,12 +27,26 @@ class CountingSort:
         self.speed = tk.DoubleVar(value=0.6)
         self.step_mode = tk.BooleanVar(value=False)
         self.step_event = threading.Event()
+        self.stop_event = threading.Event()
+
+        # Salinan nilai kontrol untuk worker (variabel Tk hanya boleh dibaca di main loop)
+        self.jeda = self.speed.get()
+        self.mode_langkah = self.step_mode.get()
+        self.speed.trace_add("write", self.sync_controls)
+        self.step_mode.trace_add("write", self.sync_controls)
+
+        # Worker -> main loop: (jenis, isi) diproses oleh drain_events
+        self.events = queue.Queue()
+        self.player_lock = threading.Lock()
 
         self.data = []
         self.count = []
         self.output = []
+        self.player = None
+        self.langkah = tk.IntVar(value=0)
 
         self.build_ui()
+        self.root.after(INTERVAL_UI_MS, self.drain_events)
 
     # ================= UI =================
     def build_ui(self):
@@ -51,6 +77,17 @@ class CountingSort:
             orient="horizontal", variable=self.speed, length=250
         ).grid(row=1, column=1, pady=5)
 
+        ttk.Button(ctrl, text="Prev Step", command=self.prev_step).grid(row=1, column=3, padx=5)
+        ttk.Button(ctrl, text="Ekspor Trace", command=self.export_trace).grid(row=1, column=4, padx=5)
+
+        ttk.Label(ctrl, text="Langkah").grid(row=2, column=0)
+        self.slider_langkah = ttk.Scale(
+            ctrl, from_=0, to=0,
+            orient="horizontal", variable=self.langkah, length=250,
+            command=self.seek
+        )
+        self.slider_langkah.grid(row=2, column=1, pady=5)
+
         # === Grafik ===
         fig_frame = ttk.Frame(self.root)
         fig_frame.pack(pady=10)
@@ -58,6 +95,7 @@ class CountingSort:
         self.fig, self.ax = plt.subplots(figsize=(8, 4))
         self.canvas = FigureCanvasTkAgg(self.fig, master=fig_frame)
         self.canvas.get_tk_widget().pack()
+        self.renderer = BarRenderer(self.ax, self.canvas)
 
         # === Log ===
         log_frame = ttk.Frame(self.root)
@@ -69,114 +107,214 @@ class CountingSort:
 
     # ================= DRAW =================
     def draw_array(self, array, highlight=None, title="Array"):
-        self.ax.clear()
-        bars = self.ax.bar(range(len(array)), array, color="skyblue")
-
-        if highlight is not None:
-            bars[highlight].set_color("orange")
-
-        self.ax.set_title(title)
-        self.ax.set_xlabel("Index")
-        self.ax.set_ylabel("Value")
-        self.ax.grid(axis="y", linestyle="--", alpha=0.5)
-
-        # X = indeks integer
-        self.ax.set_xticks(range(len(array)))
-        self.ax.set_xticklabels([str(i) for i in range(len(array))])
-
-        # Y = nilai integer
-        max_y = max(array) if array else 1
-        self.ax.set_yticks(range(0, max_y + 1))
-        self.ax.set_yticklabels([str(i) for i in range(0, max_y + 1)])
-
-        self.canvas.draw()
+        self.renderer.draw(array, highlight=highlight, title=title)
+
+    # ================= EVENT QUEUE =================
+    def emit(self, stop_event, jenis, isi=None):
+        """
+        Dipanggil dari worker: titipkan perubahan UI ke main loop.
+        Event ditandai dengan stop_event milik worker (penanda run-nya).
+        """
+        self.events.put((stop_event, jenis, isi))
+
+    def drain_events(self):
+        """
+        Dipanggil main loop setiap INTERVAL_UI_MS. Semua event yang menumpuk
+        diproses sekaligus: baris log digabung menjadi satu insert dan hanya
+        gambar terakhir yang dirender. Event dari run lama (atau run yang sudah
+        dihentikan) dibuang.
+        """
+        log = []
+        gambar = None
+        langkah = None
+        try:
+            while True:
+                run, jenis, isi = self.events.get_nowait()
+                if run is not self.stop_event or run.is_set():
+                    continue
+                if jenis == "log":
+                    log.append(isi)
+                elif jenis == "draw":
+                    gambar = isi
+                elif jenis == "step":
+                    langkah, teks, step_gambar = isi
+                    log.append(teks)
+                    if step_gambar is not None:
+                        gambar = step_gambar
+                elif jenis == "start":
+                    self.slider_langkah.configure(to=isi)
+                    self.renderer.set_range(min(self.data), max(self.data))
+        except queue.Empty:
+            pass
+
+        if log:
+            self.write_log("".join(log))
+        if gambar is not None:
+            self.draw_array(*gambar)
+        if langkah is not None:
+            self.langkah.set(langkah)
+
+        self.root.after(INTERVAL_UI_MS, self.drain_events)
 
     # ================= CONTROL =================
-    def pause(self):
-        if self.step_mode.get():
+    def sync_controls(self, *_):
+        self.jeda = self.speed.get()
+        self.mode_langkah = self.step_mode.get()
+
+    def pause(self, stop_event):
+        """Jeda worker; menunggu stop_event miliknya sendiri, bukan milik run berikutnya."""
+        if self.mode_langkah and not stop_event.is_set():
             self.step_event.clear()
-            self.step_event.wait()
-        time.sleep(self.speed.get())
+            # Reset bisa men-set step_event sebelum clear() di atas; karena itu
+            # stop_event diperiksa ulang berkala agar worker tidak menunggu selamanya
+            while not self.step_event.wait(INTERVAL_CEK_STOP):
+                if stop_event.is_set():
+                    return
+        # wait() bisa diputus oleh Reset, berbeda dengan time.sleep
+        stop_event.wait(self.jeda)
 
     def next_step(self):
         self.step_event.set()
 
+    def prev_step(self):
+        if self.player is None:
+            return
+        with self.player_lock:
+            if self.player.langkah == 0:
+                return
+            self.player.mundur()
+            tampilan = self.step_view(self.player, lengkap=True)
+        self.show_step(*tampilan)
+
+    def seek(self, _=None):
+        if self.player is None:
+            return
+        langkah = self.langkah.get()
+        with self.player_lock:
+            if langkah == self.player.langkah:
+                return
+            self.player.seek(langkah)
+            tampilan = self.step_view(self.player, lengkap=True)
+        self.show_step(*tampilan)
+
+    def export_trace(self):
+        if self.player is None:
+            messagebox.showinfo("Info", "Jalankan sorting terlebih dahulu")
+            return
+        path = filedialog.asksaveasfilename(
+            defaultextension=".npy", filetypes=[("NumPy trace", "*.npy")]
+        )
+        if path:
+            simpan_trace(path, self.player.trace)
+
+    def write_log(self, teks):
+        self.log.insert(tk.END, teks)
+        baris = int(self.log.index("end-1c").split(".")[0])
+        if baris > MAKS_BARIS_LOG:
+            self.log.delete("1.0", f"{baris - MAKS_BARIS_LOG + 1}.0")
+        self.log.see(tk.END)
+
+    def step_view(self, player, lengkap=False):
+        """
+        Keadaan player sebagai (langkah, teks log, argumen gambar).
+        Harus dipanggil dengan player_lock; hasilnya aman dikirim antar thread.
+        Dengan lengkap=True grafik selalu ikut digambar (untuk mundur dan seek).
+        """
+        langkah = player.langkah
+        if langkah == 0:
+            return langkah, "", (player.data.copy(), None, "Data Awal")
+
+        record = player.trace[langkah - 1]
+        teks = player.pesan(langkah - 1)
+        gambar = None
+        if record["fase"] == FASE_OUTPUT:
+            gambar = (player.output.copy(), int(record["posisi"]), "Output Sementara")
+        elif lengkap:
+            gambar = (player.data.copy(), None, "Data Awal")
+        return langkah, teks, gambar
+
+    def show_step(self, langkah, teks, gambar):
+        """Menampilkan hasil step_view langsung (hanya dari main loop)."""
+        self.langkah.set(langkah)
+        if teks:
+            self.write_log(teks)
+        if gambar is not None:
+            self.draw_array(*gambar)
+
+    def stop_worker(self):
+        self.stop_event.set()
+        self.step_event.set()
+        # Buang event lama agar tidak tergambar setelah reset; event yang
+        # dikirim worker lama setelah ini dibuang oleh drain_events
+        while not self.events.empty():
+            self.events.get_nowait()
+
     def reset(self):
+        self.stop_worker()
         self.entry.delete(0, tk.END)
         self.log.delete("1.0", tk.END)
-        self.ax.clear()
-        self.canvas.draw()
+        with self.player_lock:
+            self.player = None
+        self.langkah.set(0)
+        self.slider_langkah.configure(to=0)
+        self.renderer.reset()
 
     def start(self):
         try:
             self.data = list(map(int, self.entry.get().split(",")))
+            if any(not -BATAS_INT64 <= x < BATAS_INT64 for x in self.data):
+                raise ValueError("Nilai di luar rentang int64.")
+            self.stop_worker()
+            self.stop_event = threading.Event()
             self.log.delete("1.0", tk.END)
-            threading.Thread(target=self.run).start()
+            threading.Thread(target=self.run, args=(self.stop_event, list(self.data)), daemon=True).start()
         except ValueError:
             messagebox.showerror("Error", "Input harus berupa angka")
 
     # ================= ALGORITHM =================
-    def run(self):
-        self.log.insert(tk.END, "=== COUNTING SORT DIMULAI ===\n\n")
-        self.log.insert(tk.END, f"Data awal: {self.data}\n")
-        self.log.insert(tk.END, "Grafik menampilkan kondisi awal array.\n\n")
-
-        # tampilkan data awal
-        self.draw_array(self.data, title="Data Awal")
-        self.pause()
-
-        max_val = max(self.data)
-        self.count = [0] * (max_val + 1)
-        self.output = [0] * len(self.data)
-
-        # STEP 1
-        self.log.insert(tk.END, "STEP 1: Menghitung frekuensi\n")
-        for i, num in enumerate(self.data):
-            self.count[num] += 1
-            self.log.insert(
-                tk.END,
-                f"Membaca data[{i}] = {num} → count[{num}] = {self.count[num]}\n"
-            )
-            self.pause()
-
-        # STEP 2
-        self.log.insert(tk.END, "\nSTEP 2: Prefix Sum\n")
-        for i in range(1, len(self.count)):
-            self.count[i] += self.count[i - 1]
-            self.log.insert(
-                tk.END,
-                f"prefix[{i}] menyatakan jumlah elemen ≤ {i} → {self.count[i]}\n"
-            )
-            self.pause()
-
-        # STEP 3
-        self.log.insert(
-            tk.END,
-            "\nSTEP 3: Mengisi output (iterasi dari belakang untuk stabilitas)\n"
+    def run(self, stop_event, data):
+        """Worker thread: tidak menyentuh widget Tk, hanya mengirim event."""
+        # Sorting dijalankan sekali dan direkam; GUI hanya memutar ulang trace-nya
+        player = TracePlayer(rekam_trace(data))
+        with self.player_lock:
+            if stop_event.is_set():
+                return
+            self.player = player
+        self.emit(stop_event, "start", len(player))
+
+        self.emit(
+            stop_event,
+            "log",
+            "=== COUNTING SORT DIMULAI ===\n\n"
+            f"Data awal: {data}\n"
+            "Grafik menampilkan kondisi awal array.\n\n"
         )
 
-        for i in range(len(self.data) - 1, -1, -1):
-            num = self.data[i]
-            pos = self.count[num] - 1
-
-            self.output[pos] = num
-            self.count[num] -= 1
-
-            self.log.insert(
-                tk.END,
-                f"data[{i}] = {num} → posisi akhir = [{pos}]\n"
-            )
-
-            self.draw_array(self.output, highlight=pos, title="Output Sementara")
-            self.pause()
-
-        self.log.insert(
-            tk.END,
+        # tampilkan data awal
+        self.emit(stop_event, "draw", (list(data), None, "Data Awal"))
+        self.pause(stop_event)
+
+        while not stop_event.is_set():
+            with self.player_lock:
+                if player.selesai() or stop_event.is_set():
+                    break
+                player.maju()
+                tampilan = self.step_view(player)
+            self.emit(stop_event, "step", tampilan)
+            self.pause(stop_event)
+
+        if stop_event.is_set():
+            return
+
+        self.output = player.output.tolist()
+        self.emit(
+            stop_event,
+            "log",
             "\n=== SELESAI ===\n"
             f"Output akhir (terurut): {self.output}\n"
         )
 
-        self.draw_array(self.output, title="Output Akhir (Sorted)")
+        self.emit(stop_event, "draw", (self.output, None, "Output Akhir (Sorted)"))
 
 
 # ================= MAIN =================
@@ -0,0 +1,194 @@
+"""
+Benchmark counting sort dibandingkan sorted() dan numpy.sort.
+
+Menyapu ukuran data, rentang nilai, dan distribusi, lalu menulis hasil
+dalam JSON agar bisa dibandingkan antar-versi (deteksi regresi) dan untuk
+memilih titik silang saat counting sort tidak lagi lebih cepat.
+
+Contoh:
+    python count/bench.py -o hasil.json
+    python count/bench.py --sizes 1000000 --ranges 100,1000000000 --repeat 5
+"""
+import argparse
+import json
+import platform
+import time
+
+import numpy as np
+
+from engine import StreamingHistogram, counting_sort, radix_sort, uses_radix
+
+DISTRIBUSI = ("uniform", "skewed", "duplicates")
+# Tabel count penuh (counting_sort murni) dilewati di atas rentang ini (~1 GB)
+MAKS_RENTANG_MURNI = 1 << 26
+
+
+# --- 1. Data ---
+
+def buat_data(rng, n, rentang, distribusi):
+    """Membuat n bilangan bulat int64 di [0, rentang) dengan distribusi tertentu."""
+    if distribusi == "uniform":
+        return rng.integers(0, rentang, n, dtype=np.int64)
+    if distribusi == "skewed":
+        # Zipf: sedikit nilai kecil sangat sering muncul, ekor panjang ke nilai besar
+        return np.minimum(rng.zipf(1.5, n) - 1, rentang - 1).astype(np.int64)
+    if distribusi == "duplicates":
+        # Hanya 16 nilai berbeda
+        return rng.choice(rng.integers(0, rentang, 16, dtype=np.int64), n)
+    raise ValueError(f"Distribusi tidak dikenal: {distribusi}")
+
+
+# --- 2. Metode ---
+
+def _streaming(data):
+    return np.concatenate(list(StreamingHistogram(maks_rentang=1 << 62).update(data).iter_sorted()))
+
+
+METODE = {
+    # Selalu memakai tabel count, berapa pun rentangnya
+    "counting_sort": lambda data: counting_sort(data, fallback=False),
+    # counting_sort bawaan: beralih ke radix_sort jika rentang terlalu lebar
+    "counting_sort_auto": counting_sort,
+    "radix_sort": radix_sort,
+    "streaming_histogram": _streaming,
+    "numpy_sort_stable": lambda data: np.sort(data, kind="stable"),
+    "numpy_sort_quick": lambda data: np.sort(data, kind="quicksort"),
+    "sorted": lambda data: sorted(data.tolist()),
+}
+
+
+def ukur(fungsi, data, ulang):
+    """Waktu terbaik (detik) dari beberapa kali pengulangan."""
+    terbaik = float("inf")
+    for _ in range(ulang):
+        mulai = time.perf_counter()
+        fungsi(data)
+        terbaik = min(terbaik, time.perf_counter() - mulai)
+    return terbaik
+
+
+# --- 3. Benchmark ---
+
+def jalankan(sizes, ranges, distribusi, metode, ulang=3, seed=0, maks_n_python=1_000_000):
+    hasil = []
+    for n in sizes:
+        for rentang in ranges:
+            for dist in distribusi:
+                # Seed per kombinasi agar satu kasus bisa diulang tanpa menjalankan semuanya
+                rng = np.random.default_rng([seed, n, rentang, DISTRIBUSI.index(dist)])
+                data = buat_data(rng, n, rentang, dist)
+                for nama in metode:
+                    if nama == "sorted" and n > maks_n_python:
+                        continue
+                    if nama == "streaming_histogram" and rentang > 8 * max(n, 1 << 16):
+                        continue
+                    if nama == "counting_sort" and rentang > MAKS_RENTANG_MURNI:
+                        continue
+                    detik = ukur(METODE[nama], data, ulang)
+                    baris = {
+                        "method": nama,
+                        "n": n,
+                        "range": rentang,
+                        "distribution": dist,
+                        "seconds": detik,
+                        "elements_per_second": n / detik if detik else None,
+                    }
+                    if nama == "counting_sort_auto":
+                        # Jalur yang benar-benar dipakai untuk data ini
+                        baris["path"] = "radix_sort" if uses_radix(data) else "counting_sort"
+                    hasil.append(baris)
+    return hasil
+
+
+def titik_silang(hasil, metode="counting_sort", pembanding="numpy_sort_stable"):
+    """
+    Untuk setiap (n, distribusi): rentang terbesar yang masih lebih cepat
+    dengan `metode` dibanding `pembanding` (None jika tidak pernah lebih cepat).
+    """
+    waktu = {
+        (r["method"], r["n"], r["distribution"], r["range"]): r["seconds"] for r in hasil
+    }
+    kasus = sorted({(r["n"], r["distribution"]) for r in hasil})
+    silang = []
+    for n, dist in kasus:
+        ranges = sorted({r["range"] for r in hasil if r["n"] == n and r["distribution"] == dist})
+        terbesar = None
+        for rentang in ranges:
+            a = waktu.get((metode, n, dist, rentang))
+            b = waktu.get((pembanding, n, dist, rentang))
+            if a is not None and b is not None and a < b:
+                terbesar = rentang
+        silang.append({
+            "n": n,
+            "distribution": dist,
+            "method": metode,
+            "baseline": pembanding,
+            "max_range_faster": terbesar,
+        })
+    return silang
+
+
+def _daftar_int(teks):
+    return [int(float(x)) for x in teks.split(",") if x]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark counting sort (output JSON).")
+    parser.add_argument("--sizes", type=_daftar_int, default=[1_000, 100_000, 1_000_000])
+    parser.add_argument("--ranges", type=_daftar_int, default=[16, 256, 65_536, 1 << 24, 1 << 40])
+    parser.add_argument(
+        "--distributions", type=lambda t: t.split(","), default=list(DISTRIBUSI),
+        help="daftar dipisah koma: " + ", ".join(DISTRIBUSI)
+    )
+    parser.add_argument(
+        "--methods", type=lambda t: t.split(","), default=list(METODE),
+        help="daftar dipisah koma: " + ", ".join(METODE)
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--max-python-n", type=int, default=1_000_000,
+        help="sorted() dilewati untuk n lebih besar dari ini"
+    )
+    parser.add_argument("-o", "--output", default="-", help="berkas JSON ('-' untuk stdout)")
+    args = parser.parse_args(argv)
+
+    for nama in args.methods:
+        if nama not in METODE:
+            parser.error(f"Metode tidak dikenal: {nama}")
+    for dist in args.distributions:
+        if dist not in DISTRIBUSI:
+            parser.error(f"Distribusi tidak dikenal: {dist}")
+
+    hasil = jalankan(
+        args.sizes, args.ranges, args.distributions, args.methods,
+        args.repeat, args.seed, args.max_python_n
+    )
+    laporan = {
+        "meta": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "repeat": args.repeat,
+        },
+        "results": hasil,
+        # Titik silang counting sort murni terhadap radix sort dan numpy.sort
+        "crossover": [
+            baris
+            for pembanding in ("radix_sort", "numpy_sort_stable", "numpy_sort_quick")
+            if pembanding in args.methods and "counting_sort" in args.methods
+            for baris in titik_silang(hasil, "counting_sort", pembanding)
+        ],
+    }
+
+    teks = json.dumps(laporan, indent=2)
+    if args.output == "-":
+        print(teks)
+    else:
+        with open(args.output, "w") as f:
+            f.write(teks + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+"""
+Counting sort tanpa GUI untuk berkas besar atau stdin.
+
+Contoh:
+    python count/cli.py nilai.txt -o terurut.txt
+    cat nilai.txt | python count/cli.py --output-format int32 -o terurut.bin
+    python count/cli.py skor.npy -o terurut.npy
+    python count/cli.py skor.bin --input-format int32 --output-format int32 -o terurut.bin
+"""
+import argparse
+import sys
+import warnings
+
+import numpy as np
+
+from engine import MAKS_RENTANG_STREAM, StreamingHistogram
+from mmap_io import DTYPE_BIN, buka_memmap, is_npy, tulis_memmap
+from parallel import parallel_histogram_file
+
+UKURAN_CHUNK = 16 << 20   # byte yang dibaca per chunk
+UKURAN_BUFFER = 1 << 20   # buffer I/O biner
+BARIS_PER_TULIS = 1 << 20  # baris teks maksimum per write
+FORMAT_INPUT = ("auto", "text", "npy") + DTYPE_BIN
+FORMAT_OUTPUT = ("auto", "text", "npy") + DTYPE_BIN
+
+
+# --- 1. Input ---
+
+def parse_angka(teks):
+    """Mengubah teks berisi bilangan bulat (dipisah spasi, baris, atau koma) menjadi array int64."""
+    teks = teks.replace(b",", b" ").strip()
+    if not teks:
+        return np.zeros(0, dtype=np.int64)
+    with warnings.catch_warnings():
+        # np.fromstring hanya memberi peringatan jika ada token yang bukan angka
+        warnings.simplefilter("error", DeprecationWarning)
+        try:
+            angka = np.fromstring(teks.decode("ascii"), dtype=np.int64, sep=" ")
+        except (DeprecationWarning, UnicodeDecodeError, ValueError):
+            raise ValueError("Input harus berupa bilangan bulat.") from None
+
+    # Token di luar int64 tidak ditolak np.fromstring, tetapi dipotong ke batas int64.
+    # Hanya chunk yang berisi nilai batas yang diperiksa ulang dengan int Python.
+    info = np.iinfo(np.int64)
+    if np.any((angka == info.max) | (angka == info.min)):
+        if any(not info.min <= int(token) <= info.max for token in teks.split()):
+            raise ValueError("Input harus berupa bilangan bulat.")
+    return angka
+
+
+def baca_chunk(stream, ukuran_chunk=UKURAN_CHUNK):
+    """
+    Membaca stream biner per chunk dan menghasilkan array int64.
+    Token yang terpotong di akhir chunk disimpan untuk chunk berikutnya.
+    """
+    sisa = b""
+    while True:
+        blok = stream.read(ukuran_chunk)
+        if not blok:
+            break
+        blok = sisa + blok
+        batas = max(blok.rfind(b" "), blok.rfind(b"\n"), blok.rfind(b","), blok.rfind(b"\t"))
+        if batas < 0:
+            sisa = blok
+            continue
+        sisa = blok[batas + 1:]
+        yield parse_angka(blok[:batas + 1])
+    if sisa:
+        yield parse_angka(sisa)
+
+
+# --- 2. Output ---
+
+def tulis_teks(histogram, out, batas_baris=BARIS_PER_TULIS):
+    """
+    Menulis satu angka per baris. Bucket kecil digabung, bucket besar ditulis
+    per potongan `batas_baris` baris, jadi memori tetap terbatas berapa pun count-nya.
+    """
+    potongan = []
+    jumlah = 0
+    for nilai, count in histogram.iter_counts():
+        for v, c in zip(nilai.tolist(), count.tolist()):
+            baris = b"%d\n" % v
+            while c:
+                ambil = min(c, batas_baris - jumlah)
+                potongan.append(baris * ambil)
+                jumlah += ambil
+                c -= ambil
+                if jumlah == batas_baris:
+                    out.write(b"".join(potongan))
+                    potongan, jumlah = [], 0
+    if potongan:
+        out.write(b"".join(potongan))
+
+
+def tulis_biner(histogram, out, dtype):
+    """Menulis data terurut sebagai array biner mentah (little-endian)."""
+    dtype = np.dtype(dtype).newbyteorder("<")
+    info = np.iinfo(dtype)
+    if histogram.total and (histogram.data_min < info.min or histogram.data_max > info.max):
+        raise ValueError(f"Nilai tidak muat dalam {dtype.name}.")
+    for blok in histogram.iter_sorted():
+        out.write(blok.astype(dtype).tobytes())
+
+
+# --- 3. Main ---
+
+def buka_input(path):
+    if path == "-":
+        return sys.stdin.buffer
+    return open(path, "rb", buffering=UKURAN_BUFFER)
+
+
+def buka_output(path):
+    if path == "-":
+        return sys.stdout.buffer
+    return open(path, "wb", buffering=UKURAN_BUFFER)
+
+
+def format_input(path, input_format):
+    if input_format == "auto":
+        return "npy" if is_npy(path) else "text"
+    return input_format
+
+
+def format_output(path, output_format):
+    if output_format == "auto":
+        return "npy" if is_npy(path) else "text"
+    return output_format
+
+
+def sort_streams(paths, output, input_format="auto", output_format="auto",
+                 ukuran_chunk=UKURAN_CHUNK, maks_rentang=MAKS_RENTANG_STREAM, workers=1):
+    """
+    Counting sort satu kali baca atas beberapa berkas; mengembalikan histogramnya.
+    Berkas teks dibaca per chunk, berkas biner (.npy/int32/int64) lewat memmap
+    (dengan histogram paralel jika workers > 1).
+    """
+    histogram = StreamingHistogram(maks_rentang)
+    for path in paths:
+        fmt = format_input(path, input_format)
+        if fmt != "text":
+            if path == "-":
+                raise ValueError("Input biner harus berupa berkas, bukan stdin.")
+            dtype = None if fmt == "npy" else fmt
+            if workers != 1:
+                histogram.merge(parallel_histogram_file(path, dtype, workers, maks_rentang))
+                continue
+            data = buka_memmap(path, dtype)
+            elemen = max(1, ukuran_chunk // data.itemsize)
+            for mulai in range(0, data.size, elemen):
+                histogram.update(data[mulai:mulai + elemen])
+            continue
+
+        stream = buka_input(path)
+        try:
+            for chunk in baca_chunk(stream, ukuran_chunk):
+                histogram.update(chunk)
+        finally:
+            if stream is not sys.stdin.buffer:
+                stream.close()
+
+    fmt = format_output(output, output_format)
+    if fmt != "text" and output != "-":
+        tulis_memmap(histogram, output, "int64" if fmt == "npy" else fmt)
+        return histogram
+    if fmt == "npy":
+        raise ValueError("Output .npy harus ditulis ke berkas, bukan stdout.")
+
+    out = buka_output(output)
+    try:
+        if fmt == "text":
+            tulis_teks(histogram, out)
+        else:
+            tulis_biner(histogram, out, fmt)
+        out.flush()
+    finally:
+        if out is not sys.stdout.buffer:
+            out.close()
+    return histogram
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Counting sort bilangan bulat dari berkas atau stdin (tanpa GUI)."
+    )
+    parser.add_argument(
+        "input", nargs="*", default=["-"],
+        help="berkas teks/.npy/biner berisi bilangan bulat ('-' untuk stdin)"
+    )
+    parser.add_argument(
+        "--input-format", choices=FORMAT_INPUT, default="auto",
+        help="auto: .npy jika akhiran .npy, selain itu teks; int32/int64: biner datar"
+    )
+    parser.add_argument("-o", "--output", default="-", help="berkas output ('-' untuk stdout)")
+    parser.add_argument(
+        "--output-format", choices=FORMAT_OUTPUT, default="auto",
+        help="text: satu angka per baris; npy/int32/int64: biner (lewat memmap jika ke berkas)"
+    )
+    parser.add_argument(
+        "--chunk-size", type=int, default=UKURAN_CHUNK,
+        help="jumlah byte yang dibaca per chunk"
+    )
+    parser.add_argument(
+        "--max-range", type=int, default=MAKS_RENTANG_STREAM,
+        help="jumlah bucket maksimum tabel count (membatasi memori)"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=1,
+        help="jumlah proses untuk histogram input biner (0 = semua core)"
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        histogram = sort_streams(
+            args.input, args.output, args.input_format, args.output_format,
+            args.chunk_size, args.max_range, args.workers or None
+        )
+    except (OSError, ValueError) as e:
+        parser.exit(1, f"Error: {e}\n")
+
+    print(f"{histogram.total} data diurutkan.", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
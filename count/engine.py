@@ -0,0 +1,255 @@
+import numpy as np
+
+# --- 1. Validasi Input ---
+
+def _as_int_array(array):
+    """Mengubah input menjadi array NumPy bilangan bulat (tanpa menyalin jika sudah integer)."""
+    data = np.asarray(array)
+    if data.ndim != 1:
+        data = data.ravel()
+    if data.size == 0:
+        return data.astype(np.int64)
+    if not np.issubdtype(data.dtype, np.integer):
+        raise ValueError("Data harus berupa bilangan bulat.")
+    return data
+
+
+# Jika rentang nilai (max - min + 1) melebihi FAKTOR_RENTANG * len(data),
+# tabel count akan jauh lebih besar dari datanya sendiri. Pada kasus ini
+# dipakai radix sort LSD agar memori tetap O(n + bucket).
+FAKTOR_RENTANG = 8
+RENTANG_MINIMUM = 1 << 16
+BIT_DIGIT = 8
+
+
+def _batas_rentang(n):
+    """Rentang nilai terbesar yang masih diurutkan dengan tabel count penuh."""
+    return max(FAKTOR_RENTANG * n, RENTANG_MINIMUM)
+
+
+def uses_radix(array):
+    """True jika counting_sort(array) akan beralih ke radix_sort (rentang terlalu lebar)."""
+    data = _as_int_array(array)
+    if data.size == 0:
+        return False
+    return int(data.max()) - int(data.min()) + 1 > _batas_rentang(data.size)
+
+
+def _kunci_offset(data, min_val):
+    """Menggeser data menjadi kunci unsigned (data - min) tanpa overflow."""
+    if data.dtype == np.uint64:
+        return data - np.uint64(min_val)
+    # Selisih int64 yang meluap tetap benar jika dibaca sebagai uint64
+    return (data.astype(np.int64) - np.int64(min_val)).view(np.uint64)
+
+
+# --- 2. Counting Sort (Tanpa GUI) ---
+
+def counting_sort(array, fallback=True):
+    """
+    Mengurutkan bilangan bulat (boleh negatif) dengan counting sort ter-vektorisasi.
+    Frekuensi dihitung dengan np.bincount atas (data - min) lalu output dibentuk
+    dengan np.repeat. Jika rentang nilai jauh lebih besar dari jumlah data,
+    otomatis beralih ke radix_sort (kecuali fallback=False, mis. untuk benchmark).
+    """
+    data = _as_int_array(array)
+    if data.size == 0:
+        return data
+
+    min_val, max_val = int(data.min()), int(data.max())
+    rentang = max_val - min_val + 1
+    if fallback and rentang > _batas_rentang(data.size):
+        return radix_sort(data)
+
+    count = np.bincount(_kunci_offset(data, min_val).astype(np.intp), minlength=rentang)
+    nilai = np.arange(min_val, max_val + 1, dtype=data.dtype)
+    return np.repeat(nilai, count)
+
+
+def radix_argsort(array):
+    """
+    Permutasi stabil yang mengurutkan data dengan radix sort LSD.
+    Setiap putaran adalah counting sort stabil atas satu digit BIT_DIGIT bit
+    dari kunci (data - min), sehingga bucket yang dipakai hanya 2**BIT_DIGIT.
+    """
+    data = _as_int_array(array)
+    urutan = np.arange(data.size)
+    if data.size == 0:
+        return urutan
+
+    min_val = int(data.min())
+    kunci = _kunci_offset(data, min_val)
+    rentang = int(data.max()) - min_val
+    mask = np.uint64((1 << BIT_DIGIT) - 1)
+
+    geser = 0
+    while (rentang >> geser) > 0:
+        digit = ((kunci[urutan] >> np.uint64(geser)) & mask).astype(np.uint8)
+        # argsort stabil untuk uint8 di NumPy adalah counting/radix sort O(n)
+        urutan = urutan[np.argsort(digit, kind="stable")]
+        geser += BIT_DIGIT
+    return urutan
+
+
+def radix_sort(array):
+    """Mengurutkan bilangan bulat dengan radix sort LSD (lihat radix_argsort)."""
+    data = _as_int_array(array)
+    return data[radix_argsort(data)]
+
+
+def counting_sort_steps(array):
+    """
+    Menjalankan counting sort dan mengembalikan semua hasil antara untuk animasi:
+    (nilai, count, prefix, posisi, output).
+
+    - nilai[k]  : nilai yang diwakili bucket k
+    - count[k]  : frekuensi nilai[k] (STEP 1)
+    - prefix[k] : jumlah elemen <= nilai[k] (STEP 2)
+    - posisi[i] : indeks akhir data[i] di output (STEP 3, stabil)
+    - output    : array terurut
+
+    Bucket dimulai dari nilai minimum (offset), jadi bilangan negatif didukung.
+    Jika rentang nilai terlalu lebar, hanya nilai yang benar-benar muncul
+    yang dijadikan bucket sehingga memori tetap O(n).
+    """
+    data = _as_int_array(array)
+    if data.size == 0:
+        kosong = np.zeros(0, dtype=np.int64)
+        return data, kosong, kosong, kosong, data
+
+    min_val, max_val = int(data.min()), int(data.max())
+    rentang = max_val - min_val + 1
+    if rentang > _batas_rentang(data.size):
+        nilai, count = np.unique(data, return_counts=True)
+    else:
+        count = np.bincount(_kunci_offset(data, min_val).astype(np.intp), minlength=rentang)
+        nilai = np.arange(min_val, max_val + 1, dtype=data.dtype)
+    prefix = np.cumsum(count)
+
+    # Scatter stabil: elemen dengan nilai sama mempertahankan urutan aslinya
+    urutan = np.argsort(data, kind="stable")
+    posisi = np.empty(data.size, dtype=np.int64)
+    posisi[urutan] = np.arange(data.size)
+
+    output = data[urutan]
+    return nilai, count, prefix, posisi, output
+
+
+# --- 3. Histogram Streaming ---
+
+# Batas ukuran tabel count untuk StreamingHistogram (16 juta bucket = 128 MiB)
+MAKS_RENTANG_STREAM = 1 << 24
+
+
+class StreamingHistogram:
+    """
+    Tabel count yang diperbarui per chunk, sehingga data sebesar apa pun bisa
+    diurutkan dalam satu kali baca dengan memori hanya sebesar tabel count.
+    Tabel melebar otomatis (dua kali lipat) mengikuti nilai min/max baru,
+    dan menolak data yang rentangnya melebihi maks_rentang.
+    """
+
+    def __init__(self, maks_rentang=MAKS_RENTANG_STREAM):
+        self.maks_rentang = maks_rentang
+        self.min_val = 0
+        self.count = np.zeros(0, dtype=np.int64)
+        # Nilai terkecil/terbesar yang pernah muncul (tabel bisa lebih lebar)
+        self.data_min = self.data_max = 0
+        self.total = 0
+
+    def _perlebar(self, lo, hi):
+        """Memastikan tabel count mencakup [lo, hi]."""
+        if self.count.size:
+            lama_max = self.min_val + self.count.size - 1
+            if lo >= self.min_val and hi <= lama_max:
+                return
+            # Rentang yang wajib dicakup hanya nilai yang benar-benar pernah muncul
+            lo, hi = min(lo, self.data_min), max(hi, self.data_max)
+
+        if hi - lo + 1 > self.maks_rentang:
+            raise ValueError(
+                f"Rentang nilai melebihi batas {self.maks_rentang} bucket; "
+                "gunakan radix_sort untuk data dengan rentang lebar."
+            )
+
+        baru_min, baru_max = lo, hi
+        if self.count.size:
+            # Perlebar minimal dua kali lipat agar data yang terus naik/turun
+            # tidak memicu penyalinan tabel di setiap chunk
+            tambah = self.count.size
+            if lo < self.min_val:
+                baru_min -= tambah
+            if hi > lama_max:
+                baru_max += tambah
+            lebih = (baru_max - baru_min + 1) - self.maks_rentang
+            if lebih > 0:
+                potong = min(lebih, lo - baru_min)
+                baru_min += potong
+                baru_max -= lebih - potong
+
+        count = np.zeros(baru_max - baru_min + 1, dtype=np.int64)
+        if self.count.size:
+            lama = self.count[self.data_min - self.min_val:self.data_max - self.min_val + 1]
+            geser = self.data_min - baru_min
+            count[geser:geser + lama.size] = lama
+        self.count = count
+        self.min_val = baru_min
+
+    def update(self, chunk):
+        """Menambahkan frekuensi satu chunk data ke tabel count."""
+        data = _as_int_array(chunk)
+        if data.size == 0:
+            return self
+        lo, hi = int(data.min()), int(data.max())
+        self._perlebar(lo, hi)
+        kunci = _kunci_offset(data, self.min_val).astype(np.intp)
+        self.count += np.bincount(kunci, minlength=self.count.size)
+        self._catat(lo, hi, data.size)
+        return self
+
+    def _catat(self, lo, hi, n):
+        if self.total == 0:
+            self.data_min, self.data_max = lo, hi
+        else:
+            self.data_min, self.data_max = min(self.data_min, lo), max(self.data_max, hi)
+        self.total += n
+
+    def merge(self, other):
+        """Menggabungkan histogram lain (misalnya hasil worker paralel)."""
+        if other.total == 0:
+            return self
+        self._perlebar(other.data_min, other.data_max)
+        lain = other.count[other.data_min - other.min_val:other.data_max - other.min_val + 1]
+        geser = other.data_min - self.min_val
+        self.count[geser:geser + lain.size] += lain
+        self._catat(other.data_min, other.data_max, other.total)
+        return self
+
+    def iter_counts(self, ukuran_blok=1 << 16):
+        """Menghasilkan (nilai, count) untuk bucket yang tidak kosong, per blok bucket."""
+        terisi = np.flatnonzero(self.count)
+        for mulai in range(0, terisi.size, ukuran_blok):
+            idx = terisi[mulai:mulai + ukuran_blok]
+            yield idx.astype(np.int64) + self.min_val, self.count[idx]
+
+    def iter_sorted(self, ukuran_blok=1 << 20):
+        """Menghasilkan data terurut dalam blok berisi paling banyak ukuran_blok elemen."""
+        terisi = np.flatnonzero(self.count)
+        kumulatif = np.cumsum(self.count[terisi])
+        mulai = 0
+        while mulai < terisi.size:
+            dasar = kumulatif[mulai - 1] if mulai else 0
+            akhir = int(np.searchsorted(kumulatif, dasar + ukuran_blok, side="right"))
+            if akhir == mulai:
+                # Satu nilai muncul lebih dari ukuran_blok kali: pecah menjadi beberapa blok
+                nilai = terisi[mulai] + self.min_val
+                sisa = int(self.count[terisi[mulai]])
+                while sisa > 0:
+                    k = min(sisa, ukuran_blok)
+                    yield np.full(k, nilai, dtype=np.int64)
+                    sisa -= k
+                mulai += 1
+                continue
+            idx = terisi[mulai:akhir]
+            yield np.repeat(idx.astype(np.int64) + self.min_val, self.count[idx])
+            mulai = akhir
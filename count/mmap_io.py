@@ -0,0 +1,74 @@
+"""
+Input/output biner berbasis numpy.memmap untuk job counting sort besar.
+Data tidak pernah diubah menjadi list Python; histogram dihitung langsung
+per potongan buffer yang di-mapping, dan hasil ditulis ke berkas output
+yang juga di-mapping.
+"""
+import numpy as np
+
+from engine import MAKS_RENTANG_STREAM, StreamingHistogram
+
+DTYPE_BIN = ("int32", "int64")
+UKURAN_CHUNK_ELEMEN = 1 << 22  # 4 juta elemen per potongan
+
+
+def is_npy(path):
+    return str(path).lower().endswith(".npy")
+
+
+def buka_memmap(path, dtype=None):
+    """
+    Membuka berkas .npy (dtype dari header) atau berkas biner datar
+    (dtype wajib diisi: int32/int64) sebagai memmap baca-saja.
+    """
+    if is_npy(path):
+        data = np.load(path, mmap_mode="r")
+    else:
+        if dtype not in DTYPE_BIN:
+            raise ValueError("Berkas biner datar butuh dtype int32 atau int64.")
+        data = np.memmap(path, dtype=np.dtype(dtype).newbyteorder("<"), mode="r")
+
+    if not np.issubdtype(data.dtype, np.integer):
+        raise ValueError("Data harus berupa bilangan bulat.")
+    return data.reshape(-1)
+
+
+def histogram_memmap(data, ukuran_chunk=UKURAN_CHUNK_ELEMEN, maks_rentang=MAKS_RENTANG_STREAM):
+    """Membangun StreamingHistogram dari array (atau memmap) per potongan."""
+    histogram = StreamingHistogram(maks_rentang)
+    for mulai in range(0, data.size, ukuran_chunk):
+        histogram.update(data[mulai:mulai + ukuran_chunk])
+    return histogram
+
+
+def tulis_memmap(histogram, path, dtype="int64"):
+    """Menulis data terurut ke berkas .npy atau biner datar melalui memmap."""
+    dtype = np.dtype(dtype).newbyteorder("<")
+    info = np.iinfo(dtype)
+    if histogram.total and (histogram.data_min < info.min or histogram.data_max > info.max):
+        raise ValueError(f"Nilai tidak muat dalam {dtype.name}.")
+
+    if is_npy(path):
+        out = np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=(histogram.total,))
+    elif histogram.total == 0:
+        # np.memmap tidak bisa memetakan berkas kosong
+        open(path, "wb").close()
+        return
+    else:
+        out = np.memmap(path, dtype=dtype, mode="w+", shape=(histogram.total,))
+
+    posisi = 0
+    for blok in histogram.iter_sorted():
+        out[posisi:posisi + blok.size] = blok
+        posisi += blok.size
+    out.flush()
+    del out
+
+
+def sort_memmap(input_path, output_path, dtype=None, output_dtype=None,
+                ukuran_chunk=UKURAN_CHUNK_ELEMEN, maks_rentang=MAKS_RENTANG_STREAM):
+    """Counting sort berkas biner ke berkas biner; mengembalikan histogramnya."""
+    data = buka_memmap(input_path, dtype)
+    histogram = histogram_memmap(data, ukuran_chunk, maks_rentang)
+    tulis_memmap(histogram, output_path, output_dtype or data.dtype.name)
+    return histogram
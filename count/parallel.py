@@ -0,0 +1,104 @@
+"""
+Histogram counting sort paralel dengan ProcessPoolExecutor.
+Data dibagi menjadi potongan; setiap worker membangun histogram parsial
+dari potongannya, lalu semua histogram dijumlahkan (merge). Prefix sum dan
+pengisian output dijalankan sekali atas histogram gabungan.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from engine import MAKS_RENTANG_STREAM, StreamingHistogram, _as_int_array
+from mmap_io import UKURAN_CHUNK_ELEMEN, buka_memmap
+
+# Di bawah ukuran ini biaya membuat proses lebih mahal dari histogramnya
+BATAS_PARALEL = 1 << 22
+
+
+# --- 1. Worker ---
+
+def _buka_sumber(sumber):
+    """Membuka data di proses worker tanpa menyalin: memmap berkas atau shared memory."""
+    jenis = sumber[0]
+    if jenis == "memmap":
+        _, path, dtype = sumber
+        return buka_memmap(path, dtype), None
+    _, nama, dtype, ukuran = sumber
+    shm = shared_memory.SharedMemory(name=nama)
+    return np.ndarray(ukuran, dtype=dtype, buffer=shm.buf), shm
+
+
+def _histogram_potongan(sumber, mulai, akhir, maks_rentang):
+    """Dijalankan di worker: histogram parsial untuk data[mulai:akhir]."""
+    data, shm = _buka_sumber(sumber)
+    try:
+        histogram = StreamingHistogram(maks_rentang)
+        for awal in range(mulai, akhir, UKURAN_CHUNK_ELEMEN):
+            histogram.update(data[awal:min(awal + UKURAN_CHUNK_ELEMEN, akhir)])
+        return histogram
+    finally:
+        del data
+        if shm is not None:
+            shm.close()
+
+
+def _histogram_sumber(sumber, ukuran, workers, maks_rentang):
+    batas = np.linspace(0, ukuran, workers + 1).astype(np.int64).tolist()
+    gabungan = StreamingHistogram(maks_rentang)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(_histogram_potongan, sumber, batas[i], batas[i + 1], maks_rentang)
+            for i in range(workers) if batas[i] < batas[i + 1]
+        ]
+        for future in futures:
+            gabungan.merge(future.result())
+    return gabungan
+
+
+# --- 2. API ---
+
+def parallel_histogram(array, workers=None, maks_rentang=MAKS_RENTANG_STREAM):
+    """
+    Membangun StreamingHistogram dari array secara paralel.
+    Array disalin sekali ke shared memory agar tidak di-pickle ke setiap worker.
+    """
+    data = _as_int_array(array)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or data.size < BATAS_PARALEL:
+        return StreamingHistogram(maks_rentang).update(data)
+
+    shm = shared_memory.SharedMemory(create=True, size=data.nbytes)
+    try:
+        salinan = np.ndarray(data.shape, dtype=data.dtype, buffer=shm.buf)
+        salinan[:] = data
+        del salinan
+        sumber = ("shm", shm.name, data.dtype.str, data.size)
+        return _histogram_sumber(sumber, data.size, workers, maks_rentang)
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def parallel_histogram_file(path, dtype=None, workers=None, maks_rentang=MAKS_RENTANG_STREAM):
+    """Histogram paralel atas berkas .npy/biner; setiap worker me-mapping berkasnya sendiri."""
+    data = buka_memmap(path, dtype)
+    ukuran = data.size
+    del data
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or ukuran < BATAS_PARALEL:
+        return _histogram_potongan(("memmap", path, dtype), 0, ukuran, maks_rentang)
+    return _histogram_sumber(("memmap", path, dtype), ukuran, workers, maks_rentang)
+
+
+def parallel_counting_sort(array, workers=None, maks_rentang=MAKS_RENTANG_STREAM):
+    """Counting sort dengan tahap histogram paralel."""
+    data = _as_int_array(array)
+    histogram = parallel_histogram(data, workers, maks_rentang)
+    output = np.empty(histogram.total, dtype=data.dtype)
+    posisi = 0
+    for blok in histogram.iter_sorted():
+        output[posisi:posisi + blok.size] = blok
+        posisi += blok.size
+    return output
@@ -0,0 +1,144 @@
+import numpy as np
+
+from engine import counting_sort_steps
+
+# --- 1. Format Trace ---
+
+# Setiap langkah disimpan sebagai satu record berukuran tetap (25 byte),
+# bukan string log atau gambar grafik.
+FASE_HITUNG = 1   # STEP 1: indeks = i,      nilai = data[i],  posisi = count[nilai] saat itu
+FASE_PREFIX = 2   # STEP 2: indeks = bucket, nilai = nilai,    posisi = prefix[bucket]
+FASE_OUTPUT = 3   # STEP 3: indeks = i,      nilai = data[i],  posisi = posisi akhir
+
+TRACE_DTYPE = np.dtype([
+    ("fase", np.uint8),
+    ("indeks", np.int64),
+    ("nilai", np.int64),
+    ("posisi", np.int64),
+])
+
+JUDUL_FASE = {
+    FASE_HITUNG: "STEP 1: Menghitung frekuensi\n",
+    FASE_PREFIX: "\nSTEP 2: Prefix Sum\n",
+    FASE_OUTPUT: "\nSTEP 3: Mengisi output (iterasi dari belakang untuk stabilitas)\n",
+}
+
+
+def rekam_trace(array):
+    """
+    Menjalankan counting sort satu kali dan merekam setiap langkahnya
+    sebagai array record TRACE_DTYPE (dibangun secara ter-vektorisasi).
+    """
+    data = np.asarray(array)
+    nilai, count, prefix, posisi, _ = counting_sort_steps(data)
+    n = data.size
+
+    # Jumlah kemunculan sebelumnya = posisi stabil - posisi awal bucket
+    awal = prefix - count
+    bucket = np.searchsorted(nilai, data)
+    jumlah = posisi - awal[bucket] + 1 if n else posisi
+
+    mundur = np.arange(n - 1, -1, -1)
+    k = np.arange(1, nilai.size)
+
+    trace = np.empty(n + k.size + n, dtype=TRACE_DTYPE)
+    hitung, pref, out = trace[:n], trace[n:n + k.size], trace[n + k.size:]
+
+    hitung["fase"] = FASE_HITUNG
+    hitung["indeks"] = np.arange(n)
+    hitung["nilai"] = data
+    hitung["posisi"] = jumlah
+
+    pref["fase"] = FASE_PREFIX
+    pref["indeks"] = k
+    pref["nilai"] = nilai[1:]
+    pref["posisi"] = prefix[1:]
+
+    out["fase"] = FASE_OUTPUT
+    out["indeks"] = mundur
+    out["nilai"] = data[mundur]
+    out["posisi"] = posisi[mundur]
+    return trace
+
+
+def simpan_trace(path, trace):
+    """Mengekspor trace ke berkas .npy."""
+    np.save(path, trace, allow_pickle=False)
+
+
+def muat_trace(path):
+    """Memuat trace dari berkas .npy hasil simpan_trace."""
+    trace = np.load(path, allow_pickle=False)
+    if trace.dtype != TRACE_DTYPE:
+        raise ValueError("Berkas bukan trace counting sort.")
+    return trace
+
+
+# --- 2. Pemutar Trace ---
+
+class TracePlayer:
+    """
+    Memutar ulang trace tanpa menjalankan ulang algoritma.
+    Hanya keadaan output saat ini yang disimpan; langkah mana pun bisa dicapai
+    dengan seek(), dan mundur() membatalkan satu langkah STEP 3.
+    """
+
+    def __init__(self, trace):
+        self.trace = trace
+        self.fase = trace["fase"]
+
+        hitung = trace[self.fase == FASE_HITUNG]
+        self.data = hitung["nilai"].copy()
+        self.output = np.zeros(self.data.size, dtype=np.int64)
+
+        # Indeks langkah pertama STEP 3, untuk seek ter-vektorisasi
+        self.awal_output = int(np.searchsorted(self.fase, FASE_OUTPUT))
+        self.langkah = 0  # jumlah langkah yang sudah diterapkan
+
+    def __len__(self):
+        return self.trace.size
+
+    def selesai(self):
+        return self.langkah >= self.trace.size
+
+    def maju(self):
+        """Menerapkan langkah berikutnya dan mengembalikan record-nya."""
+        record = self.trace[self.langkah]
+        if record["fase"] == FASE_OUTPUT:
+            self.output[record["posisi"]] = record["nilai"]
+        self.langkah += 1
+        return record
+
+    def mundur(self):
+        """Membatalkan langkah terakhir dan mengembalikan record-nya."""
+        self.langkah -= 1
+        record = self.trace[self.langkah]
+        if record["fase"] == FASE_OUTPUT:
+            self.output[record["posisi"]] = 0
+        return record
+
+    def seek(self, langkah):
+        """Melompat ke keadaan setelah `langkah` langkah diterapkan."""
+        langkah = min(max(int(langkah), 0), self.trace.size)
+        self.output[:] = 0
+        if langkah > self.awal_output:
+            out = self.trace[self.awal_output:langkah]
+            self.output[out["posisi"]] = out["nilai"]
+        self.langkah = langkah
+
+    def pesan(self, langkah):
+        """Membentuk teks log untuk satu langkah (dibuat saat dibutuhkan saja)."""
+        record = self.trace[langkah]
+        fase = int(record["fase"])
+        i, num, pos = int(record["indeks"]), int(record["nilai"]), int(record["posisi"])
+
+        if fase == FASE_HITUNG:
+            teks = f"Membaca data[{i}] = {num} → count[{num}] = {pos}\n"
+        elif fase == FASE_PREFIX:
+            teks = f"prefix[{num}] menyatakan jumlah elemen ≤ {num} → {pos}\n"
+        else:
+            teks = f"data[{i}] = {num} → posisi akhir = [{pos}]\n"
+
+        if langkah == 0 or self.fase[langkah - 1] != fase:
+            teks = JUDUL_FASE[fase] + teks
+        return teks
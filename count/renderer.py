@@ -0,0 +1,146 @@
+import numpy as np
+from matplotlib.patches import Rectangle
+from matplotlib.ticker import MaxNLocator
+
+WARNA_BAR = "skyblue"
+WARNA_SOROT = "orange"
+
+# Di atas batas ini setiap bar tidak lagi dibuat sebagai Rectangle sendiri,
+# melainkan satu StepPatch (satu path) yang tingginya diperbarui sekaligus.
+MAKS_BAR_TERPISAH = 300
+# Jumlah label maksimum per sumbu, supaya tick tidak menumpuk untuk n besar
+MAKS_LABEL = 12
+
+
+class BarRenderer:
+    """
+    Menggambar diagram batang secara inkremental dengan blitting.
+    Sumbu, tick, dan judul digambar sekali sebagai background; setiap langkah
+    hanya bar yang berubah yang diperbarui lalu disalin ke layar.
+    """
+
+    def __init__(self, ax, canvas):
+        self.ax = ax
+        self.canvas = canvas
+        self.background = None
+        self.artists = []
+
+        self.bars = None
+        self.stairs = None
+        self.rect_sorot = None
+
+        self.tinggi = None
+        self.sorot = None
+        self.judul = None
+        self.rentang = None
+
+        self.canvas.mpl_connect("draw_event", self._on_draw)
+
+    # ================= BACKGROUND =================
+    def _on_draw(self, event):
+        # Dipanggil setiap gambar penuh (termasuk saat jendela di-resize)
+        self.background = self.canvas.copy_from_bbox(self.ax.bbox)
+        self._draw_artists()
+
+    def _draw_artists(self):
+        for artist in self.artists:
+            self.ax.draw_artist(artist)
+
+    def set_range(self, y_min, y_max):
+        """Menetapkan rentang sumbu Y agar tidak perlu gambar ulang saat nilai berubah."""
+        self.rentang = (min(y_min, 0), max(y_max, 1))
+        self.judul = None  # paksa bangun ulang pada gambar berikutnya
+
+    def reset(self):
+        self.ax.clear()
+        self.artists = []
+        self.bars = self.stairs = self.rect_sorot = None
+        self.tinggi = self.sorot = self.judul = self.rentang = None
+        self.canvas.draw()
+
+    # ================= GAMBAR =================
+    def draw(self, array, highlight=None, title="Array"):
+        tinggi = np.asarray(array, dtype=float)
+        perlu_bangun = (
+            self.background is None
+            or title != self.judul
+            or self.tinggi is None
+            or tinggi.size != self.tinggi.size
+            or (tinggi.size and (tinggi.min() < self.ax.get_ylim()[0]
+                                 or tinggi.max() > self.ax.get_ylim()[1]))
+        )
+        if perlu_bangun:
+            self._build(tinggi, title)
+        self._update(tinggi, highlight)
+
+    def _build(self, tinggi, title):
+        """Gambar penuh: membuat artist bar satu kali dan menyimpan background."""
+        ax = self.ax
+        ax.clear()
+        n = tinggi.size
+
+        ax.set_title(title)
+        ax.set_xlabel("Index")
+        ax.set_ylabel("Value")
+        ax.grid(axis="y", linestyle="--", alpha=0.5)
+
+        # X = indeks integer, Y = nilai integer (label dibatasi MAKS_LABEL)
+        ax.xaxis.set_major_locator(MaxNLocator(nbins=MAKS_LABEL, integer=True))
+        ax.yaxis.set_major_locator(MaxNLocator(nbins=MAKS_LABEL, integer=True))
+
+        if self.rentang is not None:
+            y_min, y_max = self.rentang
+        else:
+            y_min = min(tinggi.min(), 0) if n else 0
+            y_max = max(tinggi.max(), 1) if n else 1
+        ax.set_xlim(-0.5, max(n, 1) - 0.5)
+        ax.set_ylim(y_min, y_max + 0.5)
+
+        if n <= MAKS_BAR_TERPISAH:
+            self.bars = ax.bar(range(n), tinggi, color=WARNA_BAR, animated=True)
+            self.stairs = self.rect_sorot = None
+            self.artists = list(self.bars)
+        else:
+            self.bars = None
+            self.stairs = ax.stairs(
+                tinggi, np.arange(n + 1) - 0.5, fill=True, color=WARNA_BAR, animated=True
+            )
+            self.rect_sorot = Rectangle(
+                (0, 0), 1, 0, color=WARNA_SOROT, animated=True, visible=False
+            )
+            ax.add_patch(self.rect_sorot)
+            self.artists = [self.stairs, self.rect_sorot]
+
+        self.tinggi = tinggi.copy()
+        self.sorot = None
+        self.judul = title
+        self.canvas.draw()
+
+    def _update(self, tinggi, highlight):
+        """Memperbarui hanya bar yang berubah lalu melakukan blit."""
+        berubah = np.flatnonzero(tinggi != self.tinggi)
+
+        if self.bars is not None:
+            for i in berubah:
+                self.bars[i].set_height(tinggi[i])
+            if highlight != self.sorot:
+                if self.sorot is not None:
+                    self.bars[self.sorot].set_color(WARNA_BAR)
+                if highlight is not None:
+                    self.bars[highlight].set_color(WARNA_SOROT)
+        else:
+            if berubah.size:
+                self.stairs.set_data(tinggi)
+            if highlight is None:
+                self.rect_sorot.set_visible(False)
+            else:
+                self.rect_sorot.set_bounds(highlight - 0.5, 0, 1, tinggi[highlight])
+                self.rect_sorot.set_visible(True)
+
+        if berubah.size:
+            self.tinggi[berubah] = tinggi[berubah]
+        self.sorot = highlight
+
+        self.canvas.restore_region(self.background)
+        self._draw_artists()
+        self.canvas.blit(self.ax.bbox)
@@ -2,6 +2,14 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 import plotly.express as px
+import plotly.graph_objects as go
+
+from ingest import KOLOM_BAKU, daftar_kolom, hash_konten, pratinjau, read_grouped, read_scores
+from kelompok import KOLOM_GRUP_SIMULASI, group_summary, simulate_district
+from ringkasan import StreamingStats
+from sampling import STATISTIK_SAMPEL, population_estimate, sample_statistics
+from simulasi import DISTRIBUSI, UKURAN_BLOK, simulate_scores, tabel_siswa
+from visual import LABEL_KATEGORI, WARNA_KATEGORI, histogram_3d, kategori_nilai
 
 # --- Konfigurasi Halaman ---
 st.set_page_config(layout="wide")
@@ -11,48 +19,237 @@ st.set_page_config(layout="wide")
 st.title("📊 Virtual Lab Statistika: Analisis Nilai Ujian")
 st.markdown("### Eksplorasi Data Nilai Ujian secara Interaktif dalam 3 Dimensi")
 
-# --- Input Data Simulasi ---
-st.sidebar.header("⚙️ Pengaturan Data Simulasi")
+# --- Generasi Data ---
+@st.cache_data(max_entries=8)
+def generate_data(n, v_min, v_max, skew_type, seed=0):
+    """
+    Nilai ujian simulasi (uint8, lihat simulasi.py). Di-cache per parameter,
+    jadi menggeser widget lain tidak membuat ulang data.
+    """
+    return simulate_scores(n, v_min, v_max, skew_type, seed)
 
-# Parameter input untuk data
-jumlah_siswa = st.sidebar.slider("Jumlah Siswa (N)", 10, 200, 50)
-nilai_min = st.sidebar.slider("Nilai Minimum", 0, 50, 40)
-nilai_max = st.sidebar.slider("Nilai Maksimum", 50, 100, 95)
-tingkat_kesulitan = st.sidebar.selectbox(
-    "Tingkat Kesulitan Ujian (Simulasi Distribusi)", 
-    ["Mudah (Skew Kiri)", "Normal", "Sulit (Skew Kanan)"]
-)
+@st.cache_data(max_entries=8)
+def summarize_data(n, v_min, v_max, skew_type, seed=0):
+    """Statistik satu-lintasan (lihat ringkasan.py), di-cache dengan kunci yang sama."""
+    nilai = generate_data(n, v_min, v_max, skew_type, seed)
+    return StreamingStats.from_chunks(np.array_split(nilai, max(1, len(nilai) // UKURAN_BLOK)))
 
-# --- Generasi Data ---
-def generate_data(n, v_min, v_max, skew_type):
-    # Simulasi nilai dengan distribusi tertentu
-    if skew_type == "Normal":
-        # Distribusi Normal (bell curve)
-        mu, sigma = (v_min + v_max) / 2, (v_max - v_min) / 6
-        data = np.random.normal(mu, sigma, n)
-    elif skew_type == "Mudah (Skew Kiri)":
-        # Banyak siswa mendapat nilai tinggi
-        data = np.random.beta(a=5, b=2, size=n) * (v_max - v_min) + v_min
-    else: # Sulit (Skew Kanan)
-        # Banyak siswa mendapat nilai rendah
-        data = np.random.beta(a=2, b=5, size=n) * (v_max - v_min) + v_min
-    
-    # Pastikan nilai berada di rentang [nilai_min, nilai_max] dan dibulatkan
-    data = np.clip(data, v_min, v_max).astype(int)
-    
-    df = pd.DataFrame({
-        'Nama Siswa': [f'Siswa_{i+1}' for i in range(n)],
-        'Nilai Ujian': data
-    })
-    return df
-
-df = generate_data(jumlah_siswa, nilai_min, nilai_max, tingkat_kesulitan)
+# --- Data dari Berkas ---
+def content_key(berkas):
+    """Hash isi berkas unggahan, dihitung sekali per unggahan."""
+    memo = st.session_state.setdefault("hash_berkas", {})
+    if berkas.file_id not in memo:
+        memo[berkas.file_id] = hash_konten(berkas.getvalue())
+    return memo[berkas.file_id]
+
+@st.cache_data(max_entries=4)
+def ingest_data(kunci, nama, kolom, _data):
+    """
+    Membaca berkas nilai per potongan (lihat ingest.py). Di-cache per hash isi
+    berkas (`kunci`); `_data` tidak ikut di-hash oleh Streamlit.
+    """
+    nilai, stats, dibuang = read_scores(_data, nama, kolom)
+    return nilai, stats, dibuang, pratinjau(_data, nama)
+
+@st.cache_data(max_entries=4)
+def file_columns(kunci, nama, _data):
+    return daftar_kolom(_data, nama)
+
+@st.cache_data(max_entries=8)
+def sampling_data(jumlah_sampel, ukuran_sampel, v_min, v_max, skew_type, seed=0):
+    """Statistik per sampel (lihat sampling.py), di-cache per parameter."""
+    return sample_statistics(jumlah_sampel, ukuran_sampel, v_min, v_max, skew_type, seed)
+
+@st.cache_data(max_entries=4)
+def district_data(jumlah_kelas, siswa_per_kelas, v_min, v_max, skew_type, seed=0):
+    return simulate_district(jumlah_kelas, siswa_per_kelas, v_min, v_max, skew_type, seed)
+
+@st.cache_data(max_entries=4)
+def ingest_grouped(kunci, nama, kolom, kolom_grup, _data):
+    return read_grouped(_data, nama, kolom, kolom_grup)
+
+@st.cache_data(max_entries=16)
+def grouped_summary(kunci, kolom_grup, _df):
+    """
+    Ringkasan per kelompok (lihat kelompok.py), di-cache per sumber data
+    (`kunci`) dan kunci kelompok; `_df` tidak ikut di-hash.
+    """
+    return group_summary(_df, kolom_grup)
+
+# --- Mode Lab: Distribusi Sampling ---
+mode_lab = st.sidebar.radio("Mode Lab", ["Analisis Nilai", "Distribusi Sampling", "Per Kelompok"], horizontal=True)
+
+if mode_lab == "Distribusi Sampling":
+    st.sidebar.header("🎲 Pengaturan Sampling")
+    jumlah_sampel = st.sidebar.select_slider(
+        "Jumlah Sampel", options=[100, 1_000, 10_000], value=1_000, format_func=lambda n: f"{n:,}"
+    )
+    ukuran_sampel = st.sidebar.select_slider(
+        "Ukuran Tiap Sampel (n)", options=[2, 5, 10, 30, 100, 1_000], value=30, format_func=lambda n: f"{n:,}"
+    )
+    nilai_min = st.sidebar.slider("Nilai Minimum", 0, 50, 40)
+    nilai_max = st.sidebar.slider("Nilai Maksimum", 50, 100, 95)
+    tingkat_kesulitan = st.sidebar.selectbox("Distribusi Populasi", DISTRIBUSI)
+    seed = st.sidebar.number_input("Seed Acak", 0, 2**32 - 1, 0, step=1)
+
+    statistik = sampling_data(jumlah_sampel, ukuran_sampel, nilai_min, nilai_max, tingkat_kesulitan, int(seed))
+    mu, sigma = population_estimate(statistik, ukuran_sampel)
+    se = sigma / np.sqrt(ukuran_sampel)
+
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Rata-rata Populasi (perkiraan)", f"{mu:.2f}")
+    col2.metric("SD Rata-rata Sampel", f"{statistik['Rata-rata'].std():.3f}")
+    col3.metric("σ/√n (Teorema Limit Pusat)", f"{se:.3f}")
+
+    for kolom, nama_kolom in zip(st.columns(len(STATISTIK_SAMPEL)), STATISTIK_SAMPEL):
+        # Histogram dihitung di server: yang dikirim hanya tinggi bin
+        frekuensi, tepi = np.histogram(statistik[nama_kolom], bins=40)
+        tengah = (tepi[:-1] + tepi[1:]) / 2
+        fig = go.Figure(go.Bar(x=tengah, y=frekuensi, width=np.diff(tepi), name=nama_kolom))
+        if nama_kolom == "Rata-rata" and se > 0:
+            # Kurva normal N(mu, sigma/sqrt(n)) diskalakan ke frekuensi
+            # (dilewati jika populasi konstan, sigma = 0)
+            x = np.linspace(tepi[0], tepi[-1], 200)
+            kurva = len(statistik) * np.diff(tepi)[0] * np.exp(-0.5 * ((x - mu) / se) ** 2) / (se * np.sqrt(2 * np.pi))
+            fig.add_trace(go.Scatter(x=x, y=kurva, mode="lines", name="Normal (TLP)"))
+        fig.update_layout(
+            title=f"Distribusi Sampling: {nama_kolom}", showlegend=False,
+            bargap=0, margin=dict(l=0, r=0, b=0, t=30),
+            xaxis_title=nama_kolom, yaxis_title="Jumlah Sampel",
+        )
+        kolom.plotly_chart(fig, use_container_width=True)
+
+    st.info(f"""
+**💡 Cara Membaca Distribusi Sampling:**
+1.  Setiap sampel berisi **{ukuran_sampel:,} nilai** yang ditarik dari distribusi populasi yang sama; ada **{jumlah_sampel:,} sampel**.
+2.  Histogram menunjukkan sebaran rata-rata, median dan SD dari semua sampel tersebut.
+3.  **Teorema Limit Pusat:** makin besar n, distribusi rata-rata sampel makin mendekati kurva normal dengan SD σ/√n, meskipun populasinya miring.
+""")
+    st.stop()
+
+# --- Mode Lab: Statistik per Kelompok ---
+if mode_lab == "Per Kelompok":
+    sumber = st.sidebar.radio("Sumber Data", ["Simulasi Distrik", "Unggah Berkas"], horizontal=True)
+
+    if sumber == "Simulasi Distrik":
+        st.sidebar.header("🏫 Pengaturan Distrik")
+        jumlah_kelas = st.sidebar.select_slider("Jumlah Kelas", options=[10, 50, 100, 500, 1_000], value=100)
+        siswa_per_kelas = st.sidebar.slider("Siswa per Kelas", 10, 50, 32)
+        nilai_min = st.sidebar.slider("Nilai Minimum", 0, 50, 40)
+        nilai_max = st.sidebar.slider("Nilai Maksimum", 50, 100, 95)
+        tingkat_kesulitan = st.sidebar.selectbox("Tingkat Kesulitan Ujian (Simulasi Distribusi)", DISTRIBUSI)
+        seed = st.sidebar.number_input("Seed Acak", 0, 2**32 - 1, 0, step=1)
+
+        kunci = ("simulasi", jumlah_kelas, siswa_per_kelas, nilai_min, nilai_max, tingkat_kesulitan, int(seed))
+        df = district_data(*kunci[1:])
+        kolom_grup = KOLOM_GRUP_SIMULASI
+    else:
+        st.sidebar.header("📁 Berkas Nilai per Kelas")
+        berkas = st.sidebar.file_uploader("CSV atau Parquet", type=["csv", "parquet"], key="berkas_kelompok")
+        if berkas is None:
+            st.info("Unggah berkas CSV/Parquet berisi kolom nilai (0-100) dan kolom kelompok (mis. kelas, mapel, semester).")
+            st.stop()
+
+        kunci_berkas = content_key(berkas)
+        try:
+            kolom_berkas = file_columns(kunci_berkas, berkas.name, berkas.getvalue())
+            kolom = st.sidebar.selectbox(
+                "Kolom Nilai", kolom_berkas,
+                index=kolom_berkas.index(KOLOM_BAKU) if KOLOM_BAKU in kolom_berkas else 0,
+            )
+            kolom_grup = st.sidebar.multiselect("Kolom Kelompok", [k for k in kolom_berkas if k != kolom])
+            if not kolom_grup:
+                st.info("Pilih kolom kelompok di sidebar.")
+                st.stop()
+            df, dibuang = ingest_grouped(kunci_berkas, berkas.name, kolom, tuple(kolom_grup), berkas.getvalue())
+        except ValueError as e:
+            st.error(str(e))
+            st.stop()
+
+        # group_summary membaca kolom nilai baku
+        df = df.rename(columns={kolom: KOLOM_BAKU})
+        kunci = ("berkas", kunci_berkas, kolom, tuple(kolom_grup))
+        st.sidebar.caption(f"{len(df):,} nilai dibaca" + (f", {dibuang:,} baris dibuang (kosong/di luar 0-100)" if dibuang else ""))
+
+    kunci_grup = st.multiselect("Kelompokkan Berdasarkan", kolom_grup, default=kolom_grup[:1])
+    if not kunci_grup:
+        st.info("Pilih minimal satu kolom untuk mengelompokkan.")
+        st.stop()
+
+    ringkasan = grouped_summary(kunci, tuple(kunci_grup), df)
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Jumlah Kelompok", f"{len(ringkasan):,}")
+    col2.metric("Jumlah Nilai", f"{len(df):,}")
+    col3.metric("Rentang Rata-rata Kelompok", f"{ringkasan['Rata-rata'].min():.1f} - {ringkasan['Rata-rata'].max():.1f}")
+
+    st.dataframe(ringkasan.round(2), use_container_width=True)
+
+    # Grafik dibatasi pada kelompok dengan rata-rata terendah agar tetap terbaca
+    terendah = ringkasan.nsmallest(20, "Rata-rata").reset_index()
+    terendah["Kelompok"] = terendah[kunci_grup].astype(str).agg(" / ".join, axis=1)
+    fig = px.bar(
+        terendah, x="Kelompok", y=LABEL_KATEGORI,
+        color_discrete_sequence=WARNA_KATEGORI,
+        title="20 Kelompok dengan Rata-rata Terendah: Jumlah Siswa per Kategori",
+    )
+    fig.update_layout(margin=dict(l=0, r=0, b=0, t=30), yaxis_title="Jumlah Siswa", legend_title="Kategori")
+    st.plotly_chart(fig, use_container_width=True)
+    st.stop()
+
+# --- Input Data ---
+sumber = st.sidebar.radio("Sumber Data", ["Simulasi", "Unggah Berkas"], horizontal=True)
+
+if sumber == "Simulasi":
+    st.sidebar.header("⚙️ Pengaturan Data Simulasi")
+
+    # Parameter input untuk data
+    jumlah_siswa = st.sidebar.select_slider(
+        "Jumlah Siswa (N)",
+        options=[10, 50, 100, 200, 1_000, 10_000, 100_000, 1_000_000, 10_000_000],
+        value=50,
+        format_func=lambda n: f"{n:,}",
+    )
+    nilai_min = st.sidebar.slider("Nilai Minimum", 0, 50, 40)
+    nilai_max = st.sidebar.slider("Nilai Maksimum", 50, 100, 95)
+    tingkat_kesulitan = st.sidebar.selectbox(
+        "Tingkat Kesulitan Ujian (Simulasi Distribusi)", 
+        DISTRIBUSI
+    )
+    seed = st.sidebar.number_input("Seed Acak", 0, 2**32 - 1, 0, step=1)
+
+    nilai = generate_data(jumlah_siswa, nilai_min, nilai_max, tingkat_kesulitan, int(seed))
+    stats = summarize_data(jumlah_siswa, nilai_min, nilai_max, tingkat_kesulitan, int(seed))
+    # Nama siswa hanya dibuat untuk baris yang ditampilkan
+    tabel = tabel_siswa(nilai)
+else:
+    st.sidebar.header("📁 Berkas Nilai Ujian")
+    berkas = st.sidebar.file_uploader("CSV atau Parquet", type=["csv", "parquet"])
+    if berkas is None:
+        st.info("Unggah berkas CSV/Parquet berisi kolom nilai (0-100) untuk dianalisis.")
+        st.stop()
+
+    kunci = content_key(berkas)
+    try:
+        kolom_berkas = file_columns(kunci, berkas.name, berkas.getvalue())
+        kolom = st.sidebar.selectbox(
+            "Kolom Nilai", kolom_berkas,
+            index=kolom_berkas.index(KOLOM_BAKU) if KOLOM_BAKU in kolom_berkas else 0,
+        )
+        nilai, stats, dibuang, tabel = ingest_data(kunci, berkas.name, kolom, berkas.getvalue())
+    except ValueError as e:
+        st.error(str(e))
+        st.stop()
+
+    st.sidebar.caption(f"{stats.n:,} nilai dibaca" + (f", {dibuang:,} baris dibuang (kosong/di luar 0-100)" if dibuang else ""))
+    if stats.n == 0:
+        st.warning("Tidak ada nilai yang valid di kolom ini.")
+        st.stop()
 
 # --- Perhitungan Statistika Deskriptif ---
-mean_val = df['Nilai Ujian'].mean()
-median_val = df['Nilai Ujian'].median()
-mode_val = df['Nilai Ujian'].mode()
-std_val = df['Nilai Ujian'].std()
+mean_val = stats.mean
+median_val = stats.median()
+mode_val = stats.mode()
+std_val = stats.std()
 
 col1, col2, col3, col4 = st.columns(4)
 
@@ -62,50 +259,53 @@ with col2:
     st.metric("Nilai Tengah (Median) 🎯", f"{median_val:.2f}")
 with col3:
     # Handle multiple modes or no mode easily
-    st.metric("Modus (Mode) 🏆", f"{mode_val.iloc[0] if not mode_val.empty else 'N/A'}")
+    st.metric("Modus (Mode) 🏆", f"{mode_val[0] if len(mode_val) else 'N/A'}")
 with col4:
     st.metric("Standar Deviasi (SD) 📏", f"{std_val:.2f}")
 
-st.dataframe(df.head(), use_container_width=True)
+st.dataframe(tabel, use_container_width=True)
 
 st.subheader("Visualisasi Interaktif 3D")
 
 # --- Visualisasi 3D (Histogram 3D atau Scatter Plot) ---
-# Kita akan membuat DataFrame untuk visualisasi 3D yang lebih kaya
-# Asumsi: Siswa diberi ID (1D), Nilai Ujian (2D), Frekuensi (3D - Tinggi bar)
-
-# Data untuk visualisasi frekuensi
-nilai_counts = df['Nilai Ujian'].value_counts().reset_index()
-nilai_counts.columns = ['Nilai Ujian', 'Frekuensi']
-nilai_counts['Kategori'] = pd.cut(nilai_counts['Nilai Ujian'], 
-                                   bins=[0, 70, 80, 100], 
-                                   labels=['Kurang (<70)', 'Cukup (70-80)', 'Baik (>80)'], 
-                                   right=False)
-
-# Tambahkan sumbu Z buatan agar bisa divisualisasikan 3D
-# Sumbu Z bisa merepresentasikan 'Kategori' atau 'Frekuensi' itu sendiri.
-# Kita pakai Frekuensi untuk Z, dan Nilai untuk X, Kategori untuk Y (Warna)
-
-fig = px.scatter_3d(
-    nilai_counts, 
-    x='Nilai Ujian', 
-    y='Kategori', # Gunakan Kategori sebagai sumbu Y untuk pemisahan visual
-    z='Frekuensi', 
-    color='Kategori', # Gunakan warna untuk membedakan kategori
-    size='Frekuensi', # Ukuran marker berdasarkan frekuensi
-    hover_data=['Nilai Ujian', 'Frekuensi'],
-    title="Distribusi Nilai Ujian dalam Ruang 3D"
+# Mode agregat: nilai di-bin di server (visual.py), jadi ukuran figure tetap
+# berapa pun jumlah siswanya. Mode titik menggambar satu marker per nilai.
+mode_visual = st.radio(
+    "Mode Visualisasi", ["Batang 3D (Agregat)", "Titik per Nilai"], horizontal=True
 )
 
-# Sesuaikan tampilan
-fig.update_layout(
-    margin=dict(l=0, r=0, b=0, t=30),
-    scene = dict(
-        xaxis_title='Nilai Ujian',
-        yaxis_title='Kategori Nilai',
-        zaxis_title='Frekuensi Kemunculan'
+if mode_visual == "Batang 3D (Agregat)":
+    lebar_bin = st.select_slider("Lebar Bin Nilai", options=[1, 2, 5, 10], value=5)
+    fig = histogram_3d(stats.count, lebar_bin)
+else:
+    # Data untuk visualisasi frekuensi (paling banyak 101 nilai berbeda)
+    nilai_counts = stats.value_counts().reset_index()
+    nilai_counts.columns = ['Nilai Ujian', 'Frekuensi']
+    nilai_counts['Kategori'] = pd.Categorical.from_codes(
+        kategori_nilai(nilai_counts['Nilai Ujian'].to_numpy()), LABEL_KATEGORI
+    )
+
+    # Kita pakai Frekuensi untuk Z, dan Nilai untuk X, Kategori untuk Y (Warna)
+    fig = px.scatter_3d(
+        nilai_counts, 
+        x='Nilai Ujian', 
+        y='Kategori', # Gunakan Kategori sebagai sumbu Y untuk pemisahan visual
+        z='Frekuensi', 
+        color='Kategori', # Gunakan warna untuk membedakan kategori
+        size='Frekuensi', # Ukuran marker berdasarkan frekuensi
+        hover_data=['Nilai Ujian', 'Frekuensi'],
+        title="Distribusi Nilai Ujian dalam Ruang 3D"
+    )
+
+    # Sesuaikan tampilan
+    fig.update_layout(
+        margin=dict(l=0, r=0, b=0, t=30),
+        scene = dict(
+            xaxis_title='Nilai Ujian',
+            yaxis_title='Kategori Nilai',
+            zaxis_title='Frekuensi Kemunculan'
+        )
     )
-)
 
 st.plotly_chart(fig, use_container_width=True)
 
@@ -0,0 +1,148 @@
+"""
+Membaca nilai ujian asli dari berkas CSV atau Parquet.
+
+Hanya kolom nilai yang dibaca (usecols / proyeksi kolom Parquet), per
+potongan, lalu diubah ke uint8. Statistik (lihat ringkasan.py) dihitung
+sambil membaca, jadi berkas jutaan baris tidak pernah dimuat utuh sebagai
+DataFrame ber-dtype object.
+"""
+import hashlib
+import io
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+from ringkasan import MAKS_NILAI, StreamingStats
+
+UKURAN_CHUNK = 1 << 20
+BARIS_PRATINJAU = 5
+KOLOM_BAKU = "Nilai Ujian"
+
+
+def hash_konten(data):
+    """Sidik jari isi berkas; dipakai sebagai kunci cache hasil ingest."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def jenis_berkas(nama):
+    if nama.lower().endswith((".parquet", ".pq")):
+        return "parquet"
+    if nama.lower().endswith((".csv", ".txt")):
+        return "csv"
+    raise ValueError("Format berkas harus CSV atau Parquet.")
+
+
+def _parquet():
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ValueError("Membaca Parquet membutuhkan paket pyarrow.") from None
+    return pq
+
+
+def daftar_kolom(data, nama):
+    """Nama kolom berkas, tanpa membaca isinya."""
+    if jenis_berkas(nama) == "parquet":
+        return list(_parquet().ParquetFile(io.BytesIO(data)).schema_arrow.names)
+    return list(pd.read_csv(io.BytesIO(data), nrows=0).columns)
+
+
+def pratinjau(data, nama, jumlah=BARIS_PRATINJAU):
+    """Beberapa baris pertama (semua kolom) untuk ditampilkan."""
+    if jenis_berkas(nama) == "parquet":
+        berkas = _parquet().ParquetFile(io.BytesIO(data))
+        batch = next(berkas.iter_batches(batch_size=jumlah), None)
+        if batch is None:
+            # Berkas tanpa baris: tabel kosong dengan kolom sesuai skema
+            return berkas.schema_arrow.empty_table().to_pandas()
+        return batch.to_pandas()
+    return pd.read_csv(io.BytesIO(data), nrows=jumlah)
+
+
+def _potongan(data, nama, kolom, ukuran_chunk):
+    """Potongan kolom nilai sebagai array float32 (NaN untuk sel kosong)."""
+    if jenis_berkas(nama) == "parquet":
+        berkas = _parquet().ParquetFile(io.BytesIO(data))
+        for batch in berkas.iter_batches(batch_size=ukuran_chunk, columns=[kolom]):
+            yield batch.column(0).to_numpy(zero_copy_only=False).astype(np.float32)
+        return
+    for chunk in pd.read_csv(
+        io.BytesIO(data), usecols=[kolom], dtype={kolom: np.float32}, chunksize=ukuran_chunk
+    ):
+        yield chunk[kolom].to_numpy()
+
+
+def read_scores(data, nama, kolom=KOLOM_BAKU, ukuran_chunk=UKURAN_CHUNK):
+    """
+    Membaca kolom nilai dari isi berkas (bytes).
+    Nilai dibulatkan ke bilangan bulat terdekat; baris kosong atau di luar
+    0..100 dibuang. Mengembalikan (nilai uint8, StreamingStats, jumlah baris dibuang).
+    """
+    if kolom not in daftar_kolom(data, nama):
+        raise ValueError(f"Kolom '{kolom}' tidak ada di berkas.")
+
+    stats = StreamingStats()
+    potongan = []
+    dibuang = 0
+    try:
+        for chunk in _potongan(data, nama, kolom, ukuran_chunk):
+            chunk = np.rint(chunk)
+            valid = (chunk >= 0) & (chunk <= MAKS_NILAI)  # NaN selalu False
+            dibuang += int(chunk.size - np.count_nonzero(valid))
+            nilai = chunk[valid].astype(np.uint8)
+            stats.update(nilai)
+            potongan.append(nilai)
+    except (KeyError, ValueError) as e:
+        raise ValueError(f"Kolom '{kolom}' tidak bisa dibaca sebagai angka: {e}") from None
+
+    nilai = np.concatenate(potongan) if potongan else np.zeros(0, dtype=np.uint8)
+    return nilai, stats, dibuang
+
+
+def _potongan_grup(data, nama, kolom, kolom_grup, ukuran_chunk):
+    """Potongan DataFrame: kolom kelompok sebagai Categorical, kolom nilai float32."""
+    if jenis_berkas(nama) == "parquet":
+        berkas = _parquet().ParquetFile(io.BytesIO(data))
+        for batch in berkas.iter_batches(batch_size=ukuran_chunk, columns=[*kolom_grup, kolom]):
+            df = batch.to_pandas()
+            yield df.astype({g: "category" for g in kolom_grup} | {kolom: np.float32})
+        return
+    yield from pd.read_csv(
+        io.BytesIO(data), usecols=[*kolom_grup, kolom],
+        dtype={g: "category" for g in kolom_grup} | {kolom: np.float32},
+        chunksize=ukuran_chunk,
+    )
+
+
+def read_grouped(data, nama, kolom, kolom_grup, ukuran_chunk=UKURAN_CHUNK):
+    """
+    Seperti read_scores, tetapi ikut membaca kolom kelompok (kelas, mapel, ...).
+    Mengembalikan (DataFrame kolom kelompok Categorical + nilai uint8, jumlah baris dibuang).
+    """
+    kolom_grup = list(kolom_grup)
+    tersedia = daftar_kolom(data, nama)
+    for k in [kolom, *kolom_grup]:
+        if k not in tersedia:
+            raise ValueError(f"Kolom '{k}' tidak ada di berkas.")
+    if kolom in kolom_grup:
+        raise ValueError("Kolom nilai tidak boleh dipakai sebagai kolom kelompok.")
+
+    potongan = []
+    dibuang = 0
+    try:
+        for chunk in _potongan_grup(data, nama, kolom, kolom_grup, ukuran_chunk):
+            nilai = np.rint(chunk[kolom].to_numpy())
+            valid = (nilai >= 0) & (nilai <= MAKS_NILAI)
+            dibuang += int(nilai.size - np.count_nonzero(valid))
+            chunk = chunk[valid]
+            potongan.append(chunk.assign(**{kolom: nilai[valid].astype(np.uint8)}))
+    except (KeyError, ValueError) as e:
+        raise ValueError(f"Kolom '{kolom}' tidak bisa dibaca sebagai angka: {e}") from None
+
+    if not potongan:
+        return pd.DataFrame(columns=[*kolom_grup, kolom]), dibuang
+    # Kategori tiap potongan bisa berbeda; disatukan tanpa lewat dtype object
+    hasil = {g: union_categoricals([p[g] for p in potongan]) for g in kolom_grup}
+    hasil[kolom] = np.concatenate([p[kolom].to_numpy() for p in potongan])
+    return pd.DataFrame(hasil), dibuang
@@ -0,0 +1,75 @@
+"""
+Statistik per kelompok (kelas, mata pelajaran, semester) untuk banyak kelas.
+
+Data disimpan per kolom: kolom kelompok sebagai Categorical (kode integer
+kecil) dan nilai sebagai uint8. Semua statistik per kelompok dihitung dalam
+satu groupby().agg(); kategori nilai diubah sekali ke kolom 0/1 sehingga
+jumlahnya per kelompok cukup dijumlahkan (tanpa pd.cut per kelompok).
+"""
+import numpy as np
+import pandas as pd
+
+from ingest import KOLOM_BAKU
+from simulasi import tarik_nilai
+from visual import LABEL_KATEGORI, kategori_nilai
+
+KOLOM_GRUP_SIMULASI = ["Kelas", "Mata Pelajaran", "Semester"]
+MATA_PELAJARAN = ["Matematika", "Bahasa Indonesia", "IPA", "IPS", "Bahasa Inggris"]
+SEMESTER = ["Ganjil", "Genap"]
+
+
+def simulate_district(jumlah_kelas, siswa_per_kelas, v_min, v_max, skew_type, seed=0, sebaran_kelas=5.0):
+    """
+    Nilai satu distrik: setiap kombinasi kelas x mata pelajaran x semester
+    berisi `siswa_per_kelas` nilai. Tiap kelompok digeser acak (SD
+    `sebaran_kelas`) supaya rata-rata antar kelas berbeda.
+    """
+    if not 0 <= v_min <= v_max <= 255:
+        raise ValueError("Rentang nilai harus di dalam 0..255.")
+    rng = np.random.default_rng(seed)
+    ukuran = (jumlah_kelas, len(MATA_PELAJARAN), len(SEMESTER))
+    jumlah_grup = int(np.prod(ukuran))
+
+    data = tarik_nilai(rng, (jumlah_grup, siswa_per_kelas), v_min, v_max, skew_type)
+    data += rng.normal(0, sebaran_kelas, (jumlah_grup, 1))
+    nilai = np.clip(data, v_min, v_max).astype(np.uint8).reshape(-1)
+
+    # Kode kelompok untuk setiap baris, urut sama seperti `data`
+    kode = np.unravel_index(np.repeat(np.arange(jumlah_grup), siswa_per_kelas), ukuran)
+    nama_kelas = [f"Kelas_{i + 1:03d}" for i in range(jumlah_kelas)]
+    return pd.DataFrame({
+        "Kelas": pd.Categorical.from_codes(kode[0].astype(np.int32), nama_kelas),
+        "Mata Pelajaran": pd.Categorical.from_codes(kode[1].astype(np.int8), MATA_PELAJARAN),
+        "Semester": pd.Categorical.from_codes(kode[2].astype(np.int8), SEMESTER),
+        KOLOM_BAKU: nilai,
+    })
+
+
+def _modus(nilai):
+    """Nilai terkecil dengan frekuensi tertinggi (sama seperti StreamingStats.mode()[0])."""
+    return int(np.bincount(nilai.to_numpy()).argmax())
+
+
+def group_summary(df, kolom_grup, kolom_nilai=KOLOM_BAKU):
+    """
+    Rata-rata, median, modus, SD, jumlah siswa dan jumlah per kategori nilai
+    untuk setiap kelompok `kolom_grup`, dalam satu groupby().agg().
+    """
+    kolom_grup = list(kolom_grup)
+    if not kolom_grup:
+        raise ValueError("Pilih minimal satu kolom kelompok.")
+
+    kategori = kategori_nilai(df[kolom_nilai].to_numpy())
+    data = df[kolom_grup].assign(**{kolom_nilai: df[kolom_nilai]})
+    for k, label in enumerate(LABEL_KATEGORI):
+        data[label] = kategori == k
+
+    agregasi = {
+        "Jumlah Siswa": (kolom_nilai, "size"),
+        "Rata-rata": (kolom_nilai, "mean"),
+        "Median": (kolom_nilai, "median"),
+        "Modus": (kolom_nilai, _modus),
+        "SD": (kolom_nilai, "std"),
+    }
+    agregasi.update({label: (label, "sum") for label in LABEL_KATEGORI})
+    return data.groupby(kolom_grup, observed=True, sort=True).agg(**agregasi)
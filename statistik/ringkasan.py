@@ -0,0 +1,113 @@
+"""
+Statistik deskriptif satu-lintasan (one-pass) untuk nilai ujian bilangan bulat.
+
+StreamingStats menyimpan jumlah data, rata-rata dan M2 (Welford/Chan) serta
+histogram nilai 0..maks_nilai. Dari histogram, median, modus, kuantil dan
+frekuensi bisa dihitung tepat tanpa menyimpan datanya, jadi 10^8 nilai bisa
+diproses per potongan (update) atau paralel lalu digabung (merge).
+"""
+import numpy as np
+import pandas as pd
+
+MAKS_NILAI = 100
+
+
+class StreamingStats:
+    def __init__(self, maks_nilai=MAKS_NILAI):
+        self.maks_nilai = maks_nilai
+        self.count = np.zeros(maks_nilai + 1, dtype=np.int64)
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0  # jumlah kuadrat selisih terhadap rata-rata
+
+    @classmethod
+    def from_chunks(cls, chunks, maks_nilai=MAKS_NILAI):
+        stats = cls(maks_nilai)
+        for chunk in chunks:
+            stats.update(chunk)
+        return stats
+
+    # --- Akumulasi ---
+
+    def _gabung(self, n, mean, m2):
+        """Menggabungkan ringkasan (n, mean, m2) lain (rumus paralel Chan/Welford)."""
+        if n == 0:
+            return
+        total = self.n + n
+        delta = mean - self.mean
+        self.mean += delta * n / total
+        self.m2 += m2 + delta * delta * self.n * n / total
+        self.n = total
+
+    def update(self, chunk):
+        """Menambahkan satu potongan data (satu lintasan: hanya bincount)."""
+        chunk = np.asarray(chunk).reshape(-1)
+        if chunk.size == 0:
+            return self
+        if not np.issubdtype(chunk.dtype, np.integer):
+            raise ValueError("Nilai harus bilangan bulat.")
+        pesan = f"Nilai harus di antara 0 sampai {self.maks_nilai}."
+        # Rentang diperiksa lewat bincount sendiri: nilai negatif ditolak bincount
+        # (ValueError), uint64 yang tidak muat di intp gagal di-cast (TypeError
+        # atau ValueError, tergantung versi NumPy), dan nilai di atas maks_nilai
+        # membuat histogram lebih panjang dari minlength.
+        try:
+            hitung = np.bincount(chunk, minlength=self.maks_nilai + 1)
+        except (TypeError, ValueError):
+            raise ValueError(pesan) from None
+        if len(hitung) > self.maks_nilai + 1:
+            raise ValueError(pesan)
+        self.count += hitung
+
+        # Rata-rata dan M2 potongan dihitung dari histogramnya (tepat, O(maks_nilai))
+        nilai = np.arange(self.maks_nilai + 1)
+        n = int(chunk.size)
+        mean = float(hitung @ nilai) / n
+        m2 = float(hitung @ (nilai - mean) ** 2)
+        self._gabung(n, mean, m2)
+        return self
+
+    def merge(self, other):
+        if other.maks_nilai != self.maks_nilai:
+            raise ValueError("Rentang histogram tidak sama.")
+        self.count += other.count
+        self._gabung(other.n, other.mean, other.m2)
+        return self
+
+    # --- Hasil ---
+
+    def variance(self, ddof=1):
+        return self.m2 / (self.n - ddof) if self.n > ddof else float("nan")
+
+    def std(self, ddof=1):
+        return float(np.sqrt(self.variance(ddof)))
+
+    def _nilai_ke(self, k):
+        """Nilai pada peringkat k (0-based) dalam data yang terurut."""
+        return int(np.searchsorted(np.cumsum(self.count), k, side="right"))
+
+    def quantile(self, q):
+        """Kuantil dengan interpolasi linear (sama seperti pandas/numpy default)."""
+        if self.n == 0:
+            return float("nan")
+        posisi = (self.n - 1) * q
+        bawah = int(np.floor(posisi))
+        v_bawah = self._nilai_ke(bawah)
+        v_atas = self._nilai_ke(min(bawah + 1, self.n - 1))
+        return v_bawah + (posisi - bawah) * (v_atas - v_bawah)
+
+    def median(self):
+        return self.quantile(0.5)
+
+    def mode(self):
+        """Semua nilai dengan frekuensi tertinggi (terurut), seperti Series.mode()."""
+        if self.n == 0:
+            return np.array([], dtype=np.int64)
+        return np.flatnonzero(self.count == self.count.max())
+
+    def value_counts(self):
+        """Frekuensi setiap nilai yang muncul, urut dari yang paling sering."""
+        nilai = np.flatnonzero(self.count)
+        counts = pd.Series(self.count[nilai], index=nilai, name="Frekuensi")
+        counts.index.name = "Nilai Ujian"
+        return counts.sort_values(ascending=False, kind="stable")
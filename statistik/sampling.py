@@ -0,0 +1,47 @@
+"""
+Distribusi sampling (Monte Carlo): banyak sampel berulang dari distribusi
+nilai yang sama dengan simulasi.py, ditarik sebagai array 2D (sampel x siswa).
+Rata-rata, median dan SD tiap sampel dihitung sekaligus sepanjang axis=1.
+"""
+import numpy as np
+import pandas as pd
+
+from simulasi import UKURAN_BLOK, tarik_nilai
+
+STATISTIK_SAMPEL = ["Rata-rata", "Median", "SD"]
+
+
+def sample_statistics(jumlah_sampel, ukuran_sampel, v_min, v_max, skew_type, seed=0):
+    """
+    DataFrame (jumlah_sampel baris) berisi rata-rata, median dan SD (ddof=1)
+    setiap sampel berukuran `ukuran_sampel`. Sampel diproses per blok baris
+    (sekitar UKURAN_BLOK nilai) agar memori sementara tetap kecil.
+    """
+    if jumlah_sampel < 1 or ukuran_sampel < 2:
+        raise ValueError("Butuh minimal 1 sampel berukuran 2.")
+    if not 0 <= v_min <= v_max <= 255:
+        raise ValueError("Rentang nilai harus di dalam 0..255.")
+
+    rng = np.random.default_rng(seed)
+    hasil = np.empty((jumlah_sampel, len(STATISTIK_SAMPEL)))
+    baris_per_blok = max(1, UKURAN_BLOK // ukuran_sampel)
+    for awal in range(0, jumlah_sampel, baris_per_blok):
+        akhir = min(awal + baris_per_blok, jumlah_sampel)
+        blok = tarik_nilai(rng, (akhir - awal, ukuran_sampel), v_min, v_max, skew_type)
+        # Sama seperti simulate_scores: dibatasi ke [v_min, v_max] lalu dibulatkan ke bawah
+        blok = np.floor(np.clip(blok, v_min, v_max, out=blok), out=blok)
+        hasil[awal:akhir, 0] = blok.mean(axis=1)
+        hasil[awal:akhir, 2] = blok.std(axis=1, ddof=1)
+        hasil[awal:akhir, 1] = np.median(blok, axis=1, overwrite_input=True)
+    return pd.DataFrame(hasil, columns=STATISTIK_SAMPEL)
+
+
+def population_estimate(statistik, ukuran_sampel):
+    """
+    Perkiraan rata-rata dan SD populasi dari gabungan semua sampel
+    (hukum variansi total), tanpa menyimpan data mentahnya.
+    """
+    n = ukuran_sampel
+    mean = statistik["Rata-rata"].mean()
+    variansi = (statistik["SD"] ** 2).mean() * (n - 1) / n + statistik["Rata-rata"].var(ddof=0)
+    return float(mean), float(np.sqrt(variansi))
@@ -0,0 +1,59 @@
+"""
+Mesin simulasi nilai ujian untuk N besar (jutaan siswa).
+
+Nilai disimpan sebagai uint8 (1 byte per siswa) dan dibuat per blok dengan
+numpy.random.Generator ber-seed, sehingga hasilnya bisa diulang dan memori
+sementara (float64) tetap kecil. Nama siswa tidak disimpan: dibuat hanya
+untuk baris yang ditampilkan.
+"""
+import numpy as np
+import pandas as pd
+
+DISTRIBUSI = ["Mudah (Skew Kiri)", "Normal", "Sulit (Skew Kanan)"]
+UKURAN_BLOK = 1 << 20
+
+
+def tarik_nilai(rng, n, v_min, v_max, skew_type):
+    """Nilai mentah (float) dengan distribusi tertentu; `n` boleh berupa bentuk array, mis. (sampel, siswa)."""
+    if skew_type == "Normal":
+        # Distribusi Normal (bell curve)
+        mu, sigma = (v_min + v_max) / 2, (v_max - v_min) / 6
+        return rng.normal(mu, sigma, n)
+    if skew_type == "Mudah (Skew Kiri)":
+        # Banyak siswa mendapat nilai tinggi
+        return rng.beta(a=5, b=2, size=n) * (v_max - v_min) + v_min
+    if skew_type == "Sulit (Skew Kanan)":
+        # Banyak siswa mendapat nilai rendah
+        return rng.beta(a=2, b=5, size=n) * (v_max - v_min) + v_min
+    raise ValueError(f"Distribusi tidak dikenal: {skew_type}")
+
+
+def simulate_scores(n, v_min, v_max, skew_type, seed=0):
+    """
+    n nilai ujian (uint8) di rentang [v_min, v_max], dibulatkan ke bawah.
+    Hasil yang sama untuk parameter dan seed yang sama.
+    """
+    if not 0 <= v_min <= v_max <= 255:
+        raise ValueError("Rentang nilai harus di dalam 0..255.")
+    rng = np.random.default_rng(seed)
+    scores = np.empty(n, dtype=np.uint8)
+    for awal in range(0, n, UKURAN_BLOK):
+        akhir = min(awal + UKURAN_BLOK, n)
+        data = tarik_nilai(rng, akhir - awal, v_min, v_max, skew_type)
+        # Pastikan nilai berada di rentang [v_min, v_max] lalu dibulatkan
+        scores[awal:akhir] = np.clip(data, v_min, v_max)
+    return scores
+
+
+def nama_siswa(indeks):
+    """Nama untuk indeks siswa tertentu (0-based), dibuat saat dibutuhkan."""
+    return [f"Siswa_{i + 1}" for i in np.asarray(indeks).tolist()]
+
+
+def tabel_siswa(scores, mulai=0, jumlah=5):
+    """DataFrame kecil (nama + nilai) untuk sebagian baris saja."""
+    indeks = np.arange(mulai, min(mulai + jumlah, len(scores)))
+    return pd.DataFrame({
+        "Nama Siswa": nama_siswa(indeks),
+        "Nilai Ujian": scores[indeks],
+    }, index=indeks)
@@ -0,0 +1,88 @@
+"""
+Histogram 3D teragregasi: nilai dikelompokkan di server (NumPy) lalu
+digambar sebagai batang 3D (Mesh3d). Ukuran data yang dikirim ke browser
+hanya bergantung pada jumlah bin, bukan jumlah siswa.
+"""
+import numpy as np
+import plotly.graph_objects as go
+
+# Kategori nilai: [0, 70), [70, 80), [80, 100]
+BATAS_KATEGORI = [70, 80]
+LABEL_KATEGORI = ["Kurang (<70)", "Cukup (70-80)", "Baik (>80)"]
+WARNA_KATEGORI = ["#EF553B", "#FFA15A", "#00CC96"]
+
+# 8 sudut balok (x, y, z sebagai pilihan 0 = awal, 1 = akhir) dan 12 segitiga sisinya
+_SUDUT = np.array([
+    [0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0],
+    [0, 0, 1], [1, 0, 1], [1, 1, 1], [0, 1, 1],
+])
+_SEGITIGA = np.array([
+    [0, 1, 2], [0, 2, 3],  # alas
+    [4, 5, 6], [4, 6, 7],  # atas
+    [0, 1, 5], [0, 5, 4],
+    [1, 2, 6], [1, 6, 5],
+    [2, 3, 7], [2, 7, 6],
+    [3, 0, 4], [3, 4, 7],
+])
+
+
+def kategori_nilai(nilai):
+    """Indeks kategori (0, 1, 2) untuk setiap nilai, pengganti pd.cut."""
+    return np.searchsorted(BATAS_KATEGORI, nilai, side="right")
+
+
+def bin_counts(count, lebar_bin=5):
+    """
+    Histogram nilai (count[v] = frekuensi nilai v) -> array (jumlah bin, 3):
+    frekuensi per bin nilai selebar `lebar_bin` dan per kategori.
+    """
+    nilai = np.arange(len(count))
+    hasil = np.zeros((-(-len(count) // lebar_bin), len(LABEL_KATEGORI)), dtype=np.int64)
+    np.add.at(hasil, (nilai // lebar_bin, kategori_nilai(nilai)), count)
+    return hasil
+
+
+def bar_mesh(x0, x1, y0, y1, tinggi):
+    """Titik sudut dan segitiga untuk sekumpulan balok (semua argumen array sepanjang jumlah balok)."""
+    jumlah = len(tinggi)
+    awal = np.stack([x0, y0, np.zeros(jumlah)], axis=1)
+    akhir = np.stack([x1, y1, tinggi], axis=1)
+    titik = awal[:, None, :] + _SUDUT[None, :, :] * (akhir - awal)[:, None, :]
+    segitiga = _SEGITIGA[None, :, :] + 8 * np.arange(jumlah)[:, None, None]
+    return titik.reshape(-1, 3), segitiga.reshape(-1, 3)
+
+
+def histogram_3d(count, lebar_bin=5, title="Distribusi Nilai Ujian dalam Ruang 3D"):
+    """Figure batang 3D: X = bin nilai, Y = kategori, Z = frekuensi. Satu trace per kategori."""
+    tabel = bin_counts(count, lebar_bin)
+    awal_bin = np.arange(tabel.shape[0]) * lebar_bin
+
+    fig = go.Figure()
+    for k, (label, warna) in enumerate(zip(LABEL_KATEGORI, WARNA_KATEGORI)):
+        tinggi = tabel[:, k].astype(float)
+        titik, segitiga = bar_mesh(
+            awal_bin, awal_bin + 0.9 * lebar_bin,
+            np.full(len(tinggi), k - 0.35), np.full(len(tinggi), k + 0.35),
+            tinggi,
+        )
+        teks = np.repeat(
+            [f"{label}<br>Nilai {b}-{b + lebar_bin - 1}<br>Frekuensi {int(f):,}" for b, f in zip(awal_bin, tinggi)],
+            8,
+        )
+        fig.add_trace(go.Mesh3d(
+            x=titik[:, 0], y=titik[:, 1], z=titik[:, 2],
+            i=segitiga[:, 0], j=segitiga[:, 1], k=segitiga[:, 2],
+            color=warna, flatshading=True, name=label, showlegend=True,
+            hovertext=teks, hoverinfo="text",
+        ))
+
+    fig.update_layout(
+        title=title,
+        margin=dict(l=0, r=0, b=0, t=30),
+        scene=dict(
+            xaxis_title="Nilai Ujian",
+            yaxis=dict(title="Kategori Nilai", tickvals=list(range(len(LABEL_KATEGORI))), ticktext=LABEL_KATEGORI),
+            zaxis_title="Frekuensi Kemunculan",
+        ),
+    )
+    return fig
@@ -1,100 +1,105 @@
 import streamlit as st
 import numpy as np
 
+from bank import PuzzleBank, load_bank
+from grid import sudoku_grid
+from logic import NAMA_TINGKAT, CandidateGrid, jelaskan
+from puzzle_id import canonical_puzzle_id, encode_puzzle_id, generate_puzzle, new_seed, puzzle_from_id
+
 # --- 1. Logika Sudoku ---
 
-def is_valid_move(board, row, col, num):
-    """Memeriksa apakah angka 'num' valid di posisi (row, col) berdasarkan aturan Sudoku."""
-    
-    # Cek Baris
-    if num in board[row]:
-        return False
-    
-    # Cek Kolom
-    if num in board[:, col]:
-        return False
-        
-    # Cek Kotak 3x3
-    start_row = row - row % 3
-    start_col = col - col % 3
-    
-    for i in range(3):
-        for j in range(3):
-            if board[start_row + i, start_col + j] == num:
-                return False
-                
-    return True
-
-def generate_sudoku(difficulty=30):
+def generate_sudoku(difficulty=30, seed=None):
     """
     Membuat papan Sudoku yang sudah terpecahkan dan kemudian menghapus
     sejumlah angka (berdasarkan kesulitan) untuk membuat soal.
+    Soal ditentukan sepenuhnya oleh (seed, difficulty), jadi bisa dibagikan lewat ID-nya.
     """
-    # 1. Buat papan kosong
-    board = np.zeros((9, 9), dtype=int)
-    
-    # 2. Isi papan secara rekursif (hanya menginisialisasi beberapa sel awal)
-    def solve_board(b):
-        """Fungsi rekursif untuk menyelesaikan papan"""
-        for i in range(9):
-            for j in range(9):
-                if b[i, j] == 0:
-                    for num in np.random.permutation(np.arange(1, 10)):
-                        if is_valid_move(b, i, j, num):
-                            b[i, j] = num
-                            if solve_board(b):
-                                return True
-                            b[i, j] = 0  # Backtrack
-                    return False
-        return True
+    if seed is None:
+        seed = new_seed()
     
-    # Inisialisasi sudut kiri atas agar selalu terpecahkan
-    for i in range(3):
-        for j in range(3):
-            board[i, j] = (i * 3 + j) % 9 + 1
-            
-    solve_board(board)
+    # Papan penuh dibuat solver bitmask, lalu angka dihapus dengan urutan sel acak
+    # selama soal tetap memiliki tepat satu solusi (lihat puzzle_id.py)
+    board, solution = generate_puzzle(seed, difficulty) # difficulty adalah jumlah sel yang terisi
     
-    # Simpan solusi lengkap
-    solution = np.copy(board)
-    
-    # 3. Hapus angka untuk membuat soal
-    cells_to_remove = 81 - difficulty # difficulty adalah jumlah sel yang terisi
-    
-    for _ in range(cells_to_remove):
-        row, col = np.random.randint(0, 9, 2)
-        while board[row, col] == 0: # Pastikan sel yang dipilih belum kosong
-             row, col = np.random.randint(0, 9, 2)
-        board[row, col] = 0
-        
-    # Mengembalikan soal dan mask (untuk tahu sel mana yang kosong)
+    # Mengembalikan soal, mask (untuk tahu sel mana yang kosong), dan ID soal
     mask = (board != 0)
+    puzzle_id = encode_puzzle_id(seed, int(np.count_nonzero(board)))
     
-    return board, solution, mask
+    return board, solution, mask, puzzle_id
+
+@st.cache_resource
+def get_bank():
+    """Satu bank soal per server, dimuat dari disk dan diisi ulang di latar belakang."""
+    bank = PuzzleBank(load_bank())
+    bank.start_refill()
+    return bank
+
+def ambil_soal(difficulty, tingkat=None):
+    """
+    Mengambil soal dari bank (O(1)); membuat langsung hanya jika stok kosong.
+    Mengembalikan None jika soal dengan `tingkat` itu tidak berhasil dibuat.
+    """
+    soal = get_bank().ambil_atau_buat(difficulty, tingkat)
+    if soal is None:
+        if tingkat is not None:
+            return None
+        return generate_sudoku(difficulty)
+    board, solution, _, puzzle_id = soal
+    return board, solution, (board != 0), puzzle_id
+
+def soal_dari_id(puzzle_id):
+    """Membuat ulang soal dari ID-nya (dari cache LRU jika baru saja dibuat)."""
+    board, solution = puzzle_from_id(puzzle_id)
+    return board, solution, (board != 0), canonical_puzzle_id(puzzle_id)
 
 def is_solved(board, solution):
     """Memeriksa apakah papan saat ini sama dengan solusi."""
     return np.array_equal(board, solution)
 
+def mulai_soal(soal):
+    """Memasang soal ke session state dan menaruh ID-nya di URL agar bisa dibagikan."""
+    st.session_state.board, st.session_state.solution, st.session_state.mask, st.session_state.puzzle_id = soal
+    st.session_state.initial_board = np.copy(st.session_state.board)
+    st.session_state.grid = CandidateGrid(st.session_state.board)
+    st.query_params["id"] = st.session_state.puzzle_id
+
 # --- 2. Inisialisasi Streamlit State ---
 
 if 'board' not in st.session_state:
     st.session_state.difficulty = 30 # Default kesulitan: 30 sel terisi
-    st.session_state.board, st.session_state.solution, st.session_state.mask = generate_sudoku(st.session_state.difficulty)
-    st.session_state.initial_board = np.copy(st.session_state.board)
+    st.session_state.tingkat = None # Semua tingkat teknik
     st.session_state.message = ""
+    try:
+        mulai_soal(soal_dari_id(st.query_params["id"]))
+    except (KeyError, ValueError):
+        mulai_soal(ambil_soal(st.session_state.difficulty))
 
 # --- 3. Fungsi Streamlit UI dan Logika Interaksi ---
 
 def new_game():
     """Membuat permainan baru dan mereset state."""
-    st.session_state.board, st.session_state.solution, st.session_state.mask = generate_sudoku(st.session_state.difficulty)
-    st.session_state.initial_board = np.copy(st.session_state.board)
+    soal = ambil_soal(st.session_state.difficulty, st.session_state.tingkat)
+    if soal is None:
+        st.session_state.message = (
+            f"Soal tingkat {NAMA_TINGKAT[st.session_state.tingkat]} dengan {st.session_state.difficulty} "
+            "angka awal belum tersedia. Coba jumlah angka lain atau tunggu stok terisi."
+        )
+        return
+    mulai_soal(soal)
     st.session_state.message = "Game baru dimulai!"
 
+def load_game():
+    """Memuat soal dari ID yang dimasukkan user."""
+    try:
+        mulai_soal(soal_dari_id(st.session_state.input_id))
+        st.session_state.message = f"Soal {st.session_state.puzzle_id} dimuat."
+    except ValueError:
+        st.session_state.message = "ID soal tidak valid."
+
 def reset_board():
     """Meresset papan ke keadaan awal."""
     st.session_state.board = np.copy(st.session_state.initial_board)
+    st.session_state.grid = CandidateGrid(st.session_state.board)
     st.session_state.message = "Papan direset ke kondisi awal."
 
 def check_solution():
@@ -113,26 +118,49 @@ def check_solution():
     else:
         st.session_state.message = "🤔 Ada kesalahan. Coba periksa kembali angkamu!"
 
-def update_cell(r, c):
-    """Logika yang dipanggil saat user memasukkan angka di salah satu kotak."""
+def update_cell():
+    """Logika yang dipanggil saat user mengubah salah satu sel di komponen papan."""
     
-    # Ambil nilai dari input Streamlit
-    try:
-        new_val = int(st.session_state[f'cell_{r}_{c}'])
-        if new_val < 0 or new_val > 9:
-             st.session_state.message = "Input harus angka antara 1 sampai 9."
-             return
-    except ValueError:
-        new_val = 0 # Jika input kosong atau non-angka, anggap 0 (kosong)
+    # Komponen hanya mengirim sel yang berubah: {"sel": 0..80, "angka": 0..9}
+    edit = st.session_state.papan
+    if not edit:
+        return
+    r, c = divmod(int(edit["sel"]), 9)
+    new_val = int(edit["angka"])
+    if new_val < 0 or new_val > 9:
+        st.session_state.message = "Input harus angka antara 1 sampai 9."
+        return
+    if st.session_state.mask[r, c]:
+        return # Angka awal tidak bisa diubah
     
-    # Update papan
+    # Update papan (dan grid kandidat, hanya sel ini beserta tetangganya)
+    grid = st.session_state.grid
     st.session_state.board[r, c] = new_val
+    grid.set(r * 9 + c, new_val)
     st.session_state.message = ""
-    
+
+    # Cek bentrok dari jumlah angka per baris/kolom/kotak (O(1), tanpa memindai papan)
+    if grid.ada_bentrok(r * 9 + c):
+        st.session_state.message = f"⚠️ Angka {new_val} sudah ada di baris, kolom, atau kotak yang sama."
     # Jika papan penuh, langsung cek solusi
-    if 0 not in st.session_state.board:
+    elif grid.selesai():
         check_solution()
 
+def give_hint():
+    """Menampilkan langkah logis berikutnya beserta teknik yang dipakai."""
+    board = st.session_state.board
+    salah = np.argwhere((board != 0) & (board != st.session_state.solution))
+    if len(salah):
+        r, c = salah[0]
+        st.session_state.message = f"💡 Angka di sel ({r + 1}, {c + 1}) belum tepat, coba periksa lagi."
+        return
+
+    hint = st.session_state.grid.next_hint()
+    if hint is None:
+        st.session_state.message = "💡 Tidak ada langkah logis sederhana; coba tebak satu sel lalu lanjutkan."
+    else:
+        st.session_state.message = "💡 " + jelaskan(hint)
+
 
 # --- 4. Tampilan Streamlit UI ---
 
@@ -146,8 +174,17 @@ st.sidebar.header("🛠️ Pengaturan Permainan")
 
 st.sidebar.markdown("**Kesulitan:** Jumlah sel yang terisi (maks 81)")
 st.session_state.difficulty = st.sidebar.slider("Pilih Kesulitan", 20, 40, st.session_state.difficulty, step=1, on_change=new_game)
+st.sidebar.selectbox(
+    "Tingkat Teknik",
+    [None] + list(NAMA_TINGKAT),
+    format_func=lambda t: "Semua" if t is None else NAMA_TINGKAT[t],
+    key="tingkat",
+    on_change=new_game,
+)
 st.sidebar.button("Mulai Game Baru", on_click=new_game)
 st.sidebar.button("Reset Papan", on_click=reset_board)
+st.sidebar.markdown(f"**ID Soal:** `{st.session_state.puzzle_id}`")
+st.sidebar.text_input("Buka Soal dari ID", key="input_id", on_change=load_game)
 st.sidebar.markdown("---")
 st.sidebar.markdown(f"**Status Game:** {st.session_state.message}")
 
@@ -157,96 +194,14 @@ st.sidebar.markdown(f"**Status Game:** {st.session_state.message}")
 st.header("Papan Permainan")
 st.subheader(st.session_state.message)
 
-# Menggunakan kolom untuk tata letak yang lebih rapi
-board_display = st.columns(1)[0].empty()
-
-with board_display.container():
-    # Style CSS sederhana untuk membedakan kotak 3x3 dan angka awal
-    st.markdown("""
-        <style>
-        .sudoku-grid {
-            border-collapse: collapse;
-        }
-        .sudoku-grid td {
-            border: 1px solid #ccc;
-            padding: 0;
-            width: 50px;
-            height: 50px;
-            text-align: center;
-        }
-        .sudoku-grid input {
-            width: 90%;
-            height: 90%;
-            border: none;
-            text-align: center;
-            font-size: 1.2em;
-            background-color: transparent;
-            margin: auto;
-        }
-        /* Style untuk garis tebal antar kotak 3x3 */
-        .sudoku-grid tr:nth-child(3n) td { border-bottom: 3px solid #666; }
-        .sudoku-grid td:nth-child(3n) { border-right: 3px solid #666; }
-        .sudoku-grid tr:last-child td { border-bottom: 1px solid #ccc; }
-        .sudoku-grid td:last-child { border-right: 1px solid #ccc; }
-        
-        /* Style untuk angka yang sudah ada (tidak bisa diubah) */
-        .fixed-cell input {
-            font-weight: bold;
-            color: #1f77b4; /* Warna biru */
-            pointer-events: none; /* Nonaktifkan input */
-        }
-        .error-message {
-            color: red;
-            font-weight: bold;
-        }
-        </style>
-    """, unsafe_allow_html=True)
-    
-    # Membuat tabel HTML untuk papan Sudoku
-    html_table = "<table class='sudoku-grid'>"
-    
-    for r in range(9):
-        html_table += "<tr>"
-        for c in range(9):
-            is_fixed = st.session_state.mask[r, c]
-            current_val = st.session_state.board[r, c]
-            
-            # Tentukan class CSS
-            cell_class = "fixed-cell" if is_fixed else "editable-cell"
-            
-            # Gunakan st.column untuk menempatkan widget Streamlit di dalam sel tabel
-            # Note: Ini adalah pendekatan yang lebih rumit, di Streamlit kita harus menggunakan
-            # widget secara langsung, bukan embedding HTML input secara langsung.
-            
-            # *PENDAMPING UI STREAMLIT (Membuat Grid)*
-            # Karena Streamlit tidak mendukung input langsung dalam HTML string, 
-            # kita harus menggunakan kolom dan widget number_input.
-            pass # Lanjutkan dengan tata letak kolom di luar HTML string
-
-    # Tampilan Papan (Menggunakan Kolom Streamlit)
-    
-    cols = st.columns(9)
-    for r in range(9):
-        cols = st.columns(9)
-        for c in range(9):
-            with cols[c]:
-                # Tentukan nilai awal
-                val = st.session_state.board[r, c] if st.session_state.board[r, c] != 0 else ""
-                is_fixed = st.session_state.mask[r, c]
-                
-                # Input Field
-                st.number_input(
-                    label=f"c{r}{c}",
-                    value=val,
-                    min_value=0, 
-                    max_value=9, 
-                    step=1,
-                    key=f'cell_{r}_{c}',
-                    label_visibility='collapsed',
-                    disabled=is_fixed,
-                    on_change=update_cell,
-                    args=(r, c),
-                )
+# Satu komponen untuk seluruh papan (lihat grid.py); sel bentrok disorot merah
+sudoku_grid(
+    st.session_state.board,
+    st.session_state.mask,
+    konflik=st.session_state.grid.konflik(),
+    key="papan",
+    on_change=update_cell,
+)
 
 # Tombol Cek dan Petunjuk
 st.markdown("---")
@@ -254,6 +209,7 @@ col_check, col_hint = st.columns([1, 2])
 
 with col_check:
     st.button("Selesai & Cek Jawaban", on_click=check_solution, use_container_width=True)
+    st.button("Minta Petunjuk", on_click=give_hint, use_container_width=True)
 
 with col_hint:
     st.markdown("""
@@ -0,0 +1,241 @@
+"""
+Bank soal Sudoku yang dibuat di muka (offline) agar new_game() tidak perlu
+membuat soal di dalam request Streamlit.
+
+Setiap soal disimpan sebagai record 88 byte: soal dan solusi dalam bentuk
+nibble (4 bit per sel, 41 byte per papan), jumlah angka awal, tingkat teknik,
+dan seed pembuatnya (untuk ID soal, lihat puzzle_id.py).
+
+Membuat bank secara offline:
+    python sudoku/bank.py --jumlah 5000 -o sudoku/puzzles.npy
+"""
+import argparse
+import os
+import random
+import threading
+
+import numpy as np
+
+from logic import grade_puzzle
+from puzzle_id import buat_soal, encode_puzzle_id, new_seed
+from solver import UKURAN
+
+SEL = UKURAN * UKURAN
+BYTE_PAPAN = (SEL + 1) // 2
+
+BANK_DTYPE = np.dtype([
+    ("soal", np.uint8, BYTE_PAPAN),
+    ("solusi", np.uint8, BYTE_PAPAN),
+    ("clues", np.uint8),
+    ("tingkat", np.uint8),
+    ("seed", np.uint32),
+])
+
+PATH_BANK = os.path.join(os.path.dirname(os.path.abspath(__file__)), "puzzles.npy")
+CLUES_MIN, CLUES_MAX = 20, 40   # sama dengan rentang slider kesulitan
+# Soal untuk target c boleh diambil dari bucket c..c+TOLERANSI_CLUES
+# (carving di bawah ~24 angka sering berhenti sebelum target tercapai)
+TOLERANSI_CLUES = 4
+BATAS_ISI_ULANG = 20            # isi ulang jika stok satu target di bawah ini
+TARGET_ISI_ULANG = 60
+# Batas soal yang dibuat untuk mencari satu tingkat teknik tertentu; kombinasi
+# seperti 38 angka awal + tingkat 4 hampir tidak pernah muncul dari carving
+PERCOBAAN_TINGKAT = 50
+
+
+# --- 1. Format Penyimpanan ---
+
+def pack_board(board):
+    """Papan 9x9 -> 41 byte (dua sel per byte)."""
+    flat = np.zeros(BYTE_PAPAN * 2, dtype=np.uint8)
+    flat[:SEL] = np.asarray(board, dtype=np.uint8).reshape(-1)
+    return (flat[0::2] << 4) | flat[1::2]
+
+
+def unpack_board(packed):
+    """41 byte -> papan 9x9 (int)."""
+    packed = np.asarray(packed, dtype=np.uint8)
+    flat = np.empty(BYTE_PAPAN * 2, dtype=np.uint8)
+    flat[0::2] = packed >> 4
+    flat[1::2] = packed & 0x0F
+    return flat[:SEL].astype(int).reshape(UKURAN, UKURAN)
+
+
+def make_record(puzzle, solution, seed=0):
+    record = np.zeros((), dtype=BANK_DTYPE)
+    record["soal"] = pack_board(puzzle)
+    record["solusi"] = pack_board(solution)
+    record["clues"] = int(np.count_nonzero(puzzle))
+    record["tingkat"] = grade_puzzle(puzzle)
+    record["seed"] = seed
+    return record
+
+
+def generate_record(clues):
+    seed = new_seed()
+    return make_record(*buat_soal(seed, clues), seed)
+
+
+def generate_bank(jumlah, clues_min=CLUES_MIN, clues_max=CLUES_MAX):
+    """Membuat `jumlah` soal dengan target jumlah angka awal tersebar merata."""
+    bank = np.zeros(jumlah, dtype=BANK_DTYPE)
+    for k in range(jumlah):
+        bank[k] = generate_record(clues_min + k % (clues_max - clues_min + 1))
+    return bank
+
+
+def save_bank(path, bank):
+    np.save(path, bank, allow_pickle=False)
+
+
+def load_bank(path=PATH_BANK):
+    """Memuat bank dari disk; mengembalikan array kosong jika berkas belum ada."""
+    if not os.path.exists(path):
+        return np.zeros(0, dtype=BANK_DTYPE)
+    bank = np.load(path, allow_pickle=False)
+    if bank.dtype != BANK_DTYPE:
+        raise ValueError("Berkas bukan bank soal Sudoku.")
+    return bank
+
+
+# --- 2. Bank di Memori ---
+
+class PuzzleBank:
+    """
+    Stok soal yang diindeks berdasarkan (jumlah angka awal, tingkat teknik).
+    Mengambil soal adalah O(1): pilih indeks acak lalu tukar dengan elemen
+    terakhir dan pop. Thread latar belakang mengisi ulang target yang menipis.
+    """
+
+    def __init__(self, records=()):
+        self.index = {}
+        self.lock = threading.Lock()
+        self.perlu_isi = threading.Event()
+        self.diminta = set()  # (clues, tingkat) yang pernah diminta user
+        self.thread = None
+        for record in records:
+            self.tambah(record)
+
+    def tambah(self, record):
+        kunci = (int(record["clues"]), int(record["tingkat"]))
+        with self.lock:
+            self.index.setdefault(kunci, []).append(record)
+
+    def jumlah(self, clues, tingkat=None):
+        """Stok soal yang bisa melayani target `clues` (dan `tingkat` jika diisi)."""
+        with self.lock:
+            return sum(
+                len(daftar) for (c, t), daftar in self.index.items()
+                if clues <= c <= clues + TOLERANSI_CLUES and (tingkat is None or t == tingkat)
+            )
+
+    def ambil(self, clues, tingkat=None):
+        """
+        Mengambil satu soal acak: (soal, solusi, tingkat, ID soal), atau None jika kosong.
+        Bucket dengan jumlah angka awal terdekat di atas target dicoba lebih dulu.
+        """
+        with self.lock:
+            for c in range(clues, clues + TOLERANSI_CLUES + 1):
+                kunci = [k for k in self.index if k[0] == c and (tingkat is None or k[1] == tingkat)]
+                kunci = [k for k in kunci if self.index[k]]
+                if not kunci:
+                    continue
+                daftar = self.index[random.choice(kunci)]
+                j = random.randrange(len(daftar))
+                daftar[j], daftar[-1] = daftar[-1], daftar[j]
+                record = daftar.pop()
+                break
+            else:
+                record = None
+
+        if tingkat is not None:
+            with self.lock:
+                self.diminta.add((clues, tingkat))
+        self.perlu_isi.set()
+        if record is None:
+            return None
+        return self._soal(record)
+
+    @staticmethod
+    def _soal(record):
+        return (
+            unpack_board(record["soal"]),
+            unpack_board(record["solusi"]),
+            int(record["tingkat"]),
+            encode_puzzle_id(int(record["seed"]), int(record["clues"])),
+        )
+
+    def ambil_atau_buat(self, clues, tingkat=None, percobaan=PERCOBAAN_TINGKAT):
+        """
+        Seperti ambil(), tetapi jika stok kosong soal dibuat langsung sampai
+        tingkatnya cocok (paling banyak `percobaan` kali). Soal lain yang
+        terbuat masuk ke stok. Mengembalikan None jika tingkat tidak tercapai.
+        """
+        soal = self.ambil(clues, tingkat)
+        if soal is not None:
+            return soal
+        for _ in range(percobaan if tingkat is not None else 1):
+            record = generate_record(clues)
+            if (tingkat is None or int(record["tingkat"]) == tingkat) and \
+                    int(record["clues"]) <= clues + TOLERANSI_CLUES:
+                return self._soal(record)
+            self.tambah(record)
+        return None
+
+    def _isi_target(self, clues, tingkat=None):
+        stok = self.jumlah(clues, tingkat)
+        if stok >= BATAS_ISI_ULANG:
+            return
+        # Dibatasi agar target yang sulit dicapai carving tidak berputar terus
+        percobaan = 2 * (TARGET_ISI_ULANG - stok) if tingkat is None else PERCOBAAN_TINGKAT
+        for _ in range(percobaan):
+            if self.jumlah(clues, tingkat) >= TARGET_ISI_ULANG:
+                break
+            self.tambah(generate_record(clues))
+
+    def isi_ulang(self, clues_min=CLUES_MIN, clues_max=CLUES_MAX):
+        """
+        Membuat soal baru untuk setiap target yang stoknya di bawah BATAS_ISI_ULANG,
+        termasuk pasangan (jumlah angka awal, tingkat) yang pernah diminta.
+        """
+        for clues in range(clues_min, clues_max + 1):
+            self._isi_target(clues)
+        with self.lock:
+            diminta = sorted(self.diminta)
+        for clues, tingkat in diminta:
+            self._isi_target(clues, tingkat)
+
+    def _loop_isi_ulang(self):
+        while True:
+            self.perlu_isi.wait()
+            self.perlu_isi.clear()
+            self.isi_ulang()
+
+    def start_refill(self):
+        """Menjalankan thread latar belakang pengisi stok (sekali saja)."""
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._loop_isi_ulang, daemon=True)
+            self.thread.start()
+            self.perlu_isi.set()
+
+
+# --- 3. Pembuatan Bank Offline ---
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Membuat bank soal Sudoku secara offline.")
+    parser.add_argument("--jumlah", type=int, default=5000, help="jumlah soal")
+    parser.add_argument("--clues-min", type=int, default=CLUES_MIN)
+    parser.add_argument("--clues-max", type=int, default=CLUES_MAX)
+    parser.add_argument("-o", "--output", default=PATH_BANK)
+    args = parser.parse_args(argv)
+
+    bank = generate_bank(args.jumlah, args.clues_min, args.clues_max)
+    save_bank(args.output, bank)
+
+    print(f"{bank.size} soal disimpan ke {args.output}")
+    for tingkat in np.unique(bank["tingkat"]):
+        print(f"  tingkat {tingkat}: {np.count_nonzero(bank['tingkat'] == tingkat)} soal")
+
+
+if __name__ == "__main__":
+    main()
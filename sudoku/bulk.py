@@ -0,0 +1,147 @@
+"""
+Menyelesaikan banyak soal Sudoku sekaligus, misalnya untuk validasi dataset.
+
+Input: satu soal per baris, 81 karakter ('1'-'9', dengan '0' atau '.' untuk sel kosong).
+Output: CSV berisi solusi, status, jumlah node pencarian, dan waktu per soal.
+
+Contoh:
+    python sudoku/bulk.py soal.txt -o hasil.csv --workers 8
+    cat soal.txt | python sudoku/bulk.py --check-unique
+"""
+import argparse
+import csv
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from solver import UKURAN, BitmaskSolver
+
+SEL = UKURAN * UKURAN
+UKURAN_BATCH = 256
+KOLOM_CSV = ("puzzle", "solution", "status", "nodes", "microseconds")
+
+
+# --- 1. Satu Soal ---
+
+def parse_puzzle(baris):
+    """Mengubah string 81 karakter menjadi daftar 81 angka (0 = kosong)."""
+    baris = baris.strip()
+    if len(baris) != SEL:
+        raise ValueError(f"Soal harus {SEL} karakter, bukan {len(baris)}.")
+    try:
+        return [0 if ch in ".0" else int(ch) for ch in baris]
+    except ValueError:
+        raise ValueError("Soal hanya boleh berisi angka 0-9 atau '.'.") from None
+
+
+def solve_puzzle(baris, cek_unik=False):
+    """
+    Menyelesaikan satu soal. Mengembalikan (soal, solusi, status, nodes, mikrodetik).
+    Status: solved, unsolvable, invalid, atau multiple (jika cek_unik dan solusinya > 1).
+    """
+    baris = baris.strip()
+    mulai = time.perf_counter()
+    try:
+        solver = BitmaskSolver(parse_puzzle(baris))
+    except ValueError:
+        return baris, "", "invalid", 0, 0
+
+    status = "solved"
+    solusi = ""
+    nodes = 0
+    if cek_unik:
+        jumlah = solver.count_solutions(2)
+        nodes += solver.nodes
+        solver.nodes = 0
+        if jumlah == 0:
+            status = "unsolvable"
+        elif jumlah > 1:
+            status = "multiple"
+
+    if status != "unsolvable":
+        if solver.solve():
+            solusi = "".join(map(str, solver.sel))
+        else:
+            status = "unsolvable"
+        nodes += solver.nodes
+
+    mikrodetik = round((time.perf_counter() - mulai) * 1e6)
+    return baris, solusi, status, nodes, mikrodetik
+
+
+def solve_batch(daftar, cek_unik=False):
+    """Dijalankan di worker: menyelesaikan satu batch soal."""
+    return [solve_puzzle(baris, cek_unik) for baris in daftar]
+
+
+# --- 2. Banyak Soal ---
+
+def _batches(lines, ukuran):
+    lines = (baris for baris in lines if baris.strip())
+    while True:
+        batch = list(islice(lines, ukuran))
+        if not batch:
+            return
+        yield batch
+
+
+def solve_stream(lines, workers=None, ukuran_batch=UKURAN_BATCH, cek_unik=False):
+    """
+    Menyelesaikan aliran soal secara paralel per batch, dengan urutan hasil
+    sama seperti input. Jumlah batch yang berjalan dibatasi agar memori tetap
+    kecil meskipun input berisi jutaan soal.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for batch in _batches(lines, ukuran_batch):
+            yield from solve_batch(batch, cek_unik)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        antrean = []
+        for batch in _batches(lines, ukuran_batch):
+            antrean.append(pool.submit(solve_batch, batch, cek_unik))
+            if len(antrean) >= 2 * workers:
+                yield from antrean.pop(0).result()
+        for future in antrean:
+            yield from future.result()
+
+
+# --- 3. CLI ---
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Menyelesaikan banyak soal Sudoku (format 81 karakter).")
+    parser.add_argument("input", nargs="?", default="-", help="berkas soal ('-' untuk stdin)")
+    parser.add_argument("-o", "--output", default="-", help="berkas CSV hasil ('-' untuk stdout)")
+    parser.add_argument("--workers", type=int, default=0, help="jumlah proses (0 = semua core)")
+    parser.add_argument("--batch-size", type=int, default=UKURAN_BATCH)
+    parser.add_argument(
+        "--check-unique", action="store_true",
+        help="tandai soal yang solusinya lebih dari satu"
+    )
+    args = parser.parse_args(argv)
+
+    masuk = sys.stdin if args.input == "-" else open(args.input)
+    keluar = sys.stdout if args.output == "-" else open(args.output, "w", newline="")
+    mulai = time.perf_counter()
+    jumlah = 0
+    try:
+        writer = csv.writer(keluar)
+        writer.writerow(KOLOM_CSV)
+        for hasil in solve_stream(masuk, args.workers or None, args.batch_size, args.check_unique):
+            writer.writerow(hasil)
+            jumlah += 1
+    finally:
+        if masuk is not sys.stdin:
+            masuk.close()
+        if keluar is not sys.stdout:
+            keluar.close()
+
+    detik = time.perf_counter() - mulai
+    print(f"{jumlah} soal dalam {detik:.2f} detik ({jumlah / max(detik, 1e-9):.0f} soal/detik)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
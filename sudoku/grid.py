@@ -0,0 +1,29 @@
+"""
+Komponen papan Sudoku: satu iframe berisi 81 sel menggantikan 81 widget
+number_input. Setiap rerun hanya mengirim papan (81 angka), mask angka awal,
+dan daftar sel bentrok; yang dikirim balik hanya sel yang baru diubah.
+"""
+import os
+
+import numpy as np
+import streamlit.components.v1 as components
+
+_sudoku_grid = components.declare_component(
+    "sudoku_grid",
+    path=os.path.join(os.path.dirname(os.path.abspath(__file__)), "grid_frontend"),
+)
+
+
+def sudoku_grid(board, mask, konflik=(), key=None, on_change=None):
+    """
+    Menampilkan papan. Mengembalikan perubahan terakhir dari user sebagai
+    dict {"sel": indeks 0..80, "angka": 0..9, "seq": nomor urut}, atau None.
+    """
+    return _sudoku_grid(
+        board=np.asarray(board).reshape(-1).tolist(),
+        mask=np.asarray(mask).reshape(-1).tolist(),
+        konflik=list(konflik),
+        key=key,
+        default=None,
+        on_change=on_change,
+    )
@@ -0,0 +1,338 @@
+"""
+Mesin logika Sudoku ala manusia: grid kandidat yang diperbarui per langkah,
+teknik-teknik standar, petunjuk (hint), dan penilaian tingkat kesulitan.
+
+Teknik yang dikenal (dari yang paling mudah):
+naked single, hidden single, naked pair, hidden pair, pointing, box-line reduction.
+"""
+import numpy as np
+
+from solver import DIGIT, KELOMPOK, KOTAK, POPCOUNT, SEMUA, UKURAN
+
+SEL = UKURAN * UKURAN
+
+# --- 1. Tabel Bantu ---
+
+# Tiga kelompok (baris, kolom, kotak) untuk setiap sel, sebagai indeks ke KELOMPOK
+KELOMPOK_SEL = [[] for _ in range(SEL)]
+for _u, _kelompok in enumerate(KELOMPOK):
+    for _i in _kelompok:
+        KELOMPOK_SEL[_i].append(_u)
+
+# 20 "tetangga" setiap sel: sel lain yang satu baris, kolom, atau kotak
+PEER = [
+    sorted({p for u in KELOMPOK_SEL[i] for p in KELOMPOK[u]} - {i})
+    for i in range(SEL)
+]
+
+KOTAK_AWAL = 2 * UKURAN  # KELOMPOK[18:] adalah kotak
+
+# Tingkat kesulitan = teknik tersulit yang dibutuhkan
+TINGKAT_NAKED_SINGLE = 1
+TINGKAT_HIDDEN_SINGLE = 2
+TINGKAT_SUBSET = 3  # pair, pointing, box-line reduction
+TINGKAT_LANJUT = 4  # butuh teknik di luar daftar ini (atau menebak)
+NAMA_TINGKAT = {
+    TINGKAT_NAKED_SINGLE: "Mudah",
+    TINGKAT_HIDDEN_SINGLE: "Sedang",
+    TINGKAT_SUBSET: "Sulit",
+    TINGKAT_LANJUT: "Sangat Sulit",
+}
+
+TEKNIK = {
+    "naked_single": ("Naked single", TINGKAT_NAKED_SINGLE),
+    "hidden_single": ("Hidden single", TINGKAT_HIDDEN_SINGLE),
+    "naked_pair": ("Naked pair", TINGKAT_SUBSET),
+    "hidden_pair": ("Hidden pair", TINGKAT_SUBSET),
+    "pointing": ("Pointing", TINGKAT_SUBSET),
+    "box_line": ("Box-line reduction", TINGKAT_SUBSET),
+}
+
+
+def nama_sel(i):
+    return f"({i // UKURAN + 1}, {i % UKURAN + 1})"
+
+
+def nama_kelompok(u):
+    jenis = ("baris", "kolom", "kotak")[u // UKURAN]
+    return f"{jenis} {u % UKURAN + 1}"
+
+
+def _langkah(teknik, isi=None, hapus=(), kelompok=None, sel=()):
+    return {
+        "teknik": teknik,
+        "tingkat": TEKNIK[teknik][1],
+        "isi": isi,               # (sel, angka) yang pasti benar, atau None
+        "hapus": list(hapus),     # daftar (sel, angka) kandidat yang dieliminasi
+        "kelompok": kelompok,
+        "sel": list(sel),
+    }
+
+
+# --- 2. Grid Kandidat ---
+
+class CandidateGrid:
+    """
+    Papan beserta kandidat setiap sel kosong.
+    Jumlah kemunculan angka per baris/kolom/kotak disimpan, sehingga mengisi
+    atau menghapus satu sel hanya memperbarui sel itu dan 20 tetangganya.
+    """
+
+    def __init__(self, board):
+        self.sel = [0] * SEL
+        self.kand = [SEMUA] * SEL
+        self.hitung = [[0] * (UKURAN + 1) for _ in KELOMPOK]
+        self.terpakai = [0] * len(KELOMPOK)
+        # True jika ada kandidat yang dihapus oleh teknik (bukan oleh angka di tetangga)
+        self.ada_eliminasi = False
+        # Sel terisi yang angkanya bentrok dengan tetangga; diperbarui per langkah
+        self.bentrok = set()
+        self.terisi = 0
+
+        flat = np.asarray(board).reshape(-1).tolist()
+        if len(flat) != SEL:
+            raise ValueError("Papan Sudoku harus berukuran 9x9.")
+        for i, d in enumerate(flat):
+            if d:
+                self._isi(i, int(d))
+
+    def _dasar(self, i):
+        """Kandidat sel i hanya berdasarkan angka di baris, kolom, dan kotaknya."""
+        r, c, b = KELOMPOK_SEL[i]
+        return SEMUA & ~(self.terpakai[r] | self.terpakai[c] | self.terpakai[b])
+
+    def _isi(self, i, d):
+        if not 1 <= d <= UKURAN:
+            raise ValueError("Angka harus di antara 1 sampai 9.")
+        bit = 1 << d
+        self.sel[i] = d
+        self.terisi += 1
+        for u in KELOMPOK_SEL[i]:
+            self.hitung[u][d] += 1
+            self.terpakai[u] |= bit
+        self.kand[i] = 0
+        for p in PEER[i]:
+            self.kand[p] &= ~bit
+
+        if self.ada_bentrok(i):
+            self.bentrok.add(i)
+            self.bentrok.update(p for p in PEER[i] if self.sel[p] == d)
+
+    def _kosongkan(self, i):
+        d = self.sel[i]
+        self.sel[i] = 0
+        self.terisi -= 1
+        for u in KELOMPOK_SEL[i]:
+            self.hitung[u][d] -= 1
+            if not self.hitung[u][d]:
+                self.terpakai[u] &= ~(1 << d)
+
+        if i in self.bentrok:
+            self.bentrok.discard(i)
+            for p in PEER[i]:
+                if self.sel[p] == d and not self.ada_bentrok(p):
+                    self.bentrok.discard(p)
+
+        if self.ada_eliminasi:
+            # Eliminasi dari teknik bisa bergantung pada angka yang baru dihapus
+            self.hitung_ulang()
+            return
+        for p in PEER[i] + [i]:
+            if not self.sel[p]:
+                self.kand[p] = self._dasar(p)
+
+    def set(self, i, d):
+        """Mengisi sel i dengan angka d (0 = mengosongkan). O(tetangga)."""
+        if self.sel[i] == d:
+            return
+        if self.sel[i]:
+            self._kosongkan(i)
+        if d:
+            self._isi(i, d)
+
+    def hitung_ulang(self):
+        """Membuang semua eliminasi teknik dan menghitung kandidat dari papan."""
+        self.kand = [0 if self.sel[i] else self._dasar(i) for i in range(SEL)]
+        self.ada_eliminasi = False
+
+    def ada_bentrok(self, i):
+        """O(1): apakah angka di sel i juga ada di baris, kolom, atau kotaknya."""
+        d = self.sel[i]
+        return bool(d) and any(self.hitung[u][d] > 1 for u in KELOMPOK_SEL[i])
+
+    def konflik(self):
+        """Sel terisi yang angkanya muncul lebih dari sekali di baris/kolom/kotaknya."""
+        return sorted(self.bentrok)
+
+    def buntu(self):
+        """Sel kosong yang tidak punya kandidat sama sekali."""
+        return [i for i in range(SEL) if not self.sel[i] and not self.kand[i]]
+
+    def selesai(self):
+        return self.terisi == SEL
+
+    # --- Teknik ---
+
+    def _naked_single(self):
+        for i in range(SEL):
+            if not self.sel[i] and POPCOUNT[self.kand[i]] == 1:
+                return _langkah("naked_single", isi=(i, DIGIT[self.kand[i]][0]), sel=[i])
+        return None
+
+    def _tempat(self, u, d):
+        """Sel-sel di kelompok u yang masih bisa diisi angka d."""
+        return [i for i in KELOMPOK[u] if self.kand[i] >> d & 1]
+
+    def _hidden_single(self):
+        for u in range(len(KELOMPOK)):
+            for d in DIGIT[SEMUA & ~self.terpakai[u]]:
+                tempat = self._tempat(u, d)
+                if len(tempat) == 1:
+                    return _langkah("hidden_single", isi=(tempat[0], d), kelompok=u, sel=tempat)
+        return None
+
+    def _naked_pair(self):
+        for u, kelompok in enumerate(KELOMPOK):
+            pasangan = {}
+            for i in kelompok:
+                mask = self.kand[i]
+                if POPCOUNT[mask] == 2:
+                    pasangan.setdefault(mask, []).append(i)
+            for mask, sel in pasangan.items():
+                if len(sel) != 2:
+                    continue
+                hapus = [
+                    (p, d) for p in kelompok if p not in sel
+                    for d in DIGIT[self.kand[p] & mask]
+                ]
+                if hapus:
+                    return _langkah("naked_pair", hapus=hapus, kelompok=u, sel=sel)
+        return None
+
+    def _hidden_pair(self):
+        for u in range(len(KELOMPOK)):
+            posisi = {}
+            for d in DIGIT[SEMUA & ~self.terpakai[u]]:
+                tempat = self._tempat(u, d)
+                if len(tempat) == 2:
+                    posisi.setdefault(tuple(tempat), []).append(d)
+            for sel, digits in posisi.items():
+                if len(digits) != 2:
+                    continue
+                mask = (1 << digits[0]) | (1 << digits[1])
+                hapus = [(i, d) for i in sel for d in DIGIT[self.kand[i] & ~mask]]
+                if hapus:
+                    return _langkah("hidden_pair", hapus=hapus, kelompok=u, sel=sel)
+        return None
+
+    def _pointing(self):
+        # Angka d di sebuah kotak hanya mungkin di satu baris/kolom:
+        # hapus d dari baris/kolom itu di luar kotak
+        for u in range(KOTAK_AWAL, len(KELOMPOK)):
+            for d in DIGIT[SEMUA & ~self.terpakai[u]]:
+                tempat = self._tempat(u, d)
+                if len(tempat) < 2:
+                    continue
+                for garis in (0, 1):
+                    unit = {KELOMPOK_SEL[i][garis] for i in tempat}
+                    if len(unit) != 1:
+                        continue
+                    hapus = [
+                        (p, d) for p in KELOMPOK[unit.pop()]
+                        if KELOMPOK_SEL[p][2] != u and self.kand[p] >> d & 1
+                    ]
+                    if hapus:
+                        return _langkah("pointing", hapus=hapus, kelompok=u, sel=tempat)
+        return None
+
+    def _box_line(self):
+        # Angka d di sebuah baris/kolom hanya mungkin di satu kotak:
+        # hapus d dari kotak itu di luar baris/kolom tersebut
+        for u in range(KOTAK_AWAL):
+            for d in DIGIT[SEMUA & ~self.terpakai[u]]:
+                tempat = self._tempat(u, d)
+                if len(tempat) < 2 or len(tempat) > KOTAK:
+                    continue
+                kotak = {KELOMPOK_SEL[i][2] for i in tempat}
+                if len(kotak) != 1:
+                    continue
+                hapus = [
+                    (p, d) for p in KELOMPOK[kotak.pop()]
+                    if u not in KELOMPOK_SEL[p] and self.kand[p] >> d & 1
+                ]
+                if hapus:
+                    return _langkah("box_line", hapus=hapus, kelompok=u, sel=tempat)
+        return None
+
+    def langkah(self):
+        """Langkah logis termudah berikutnya, atau None jika tidak ada."""
+        for teknik in (
+            self._naked_single, self._hidden_single, self._naked_pair,
+            self._hidden_pair, self._pointing, self._box_line,
+        ):
+            hasil = teknik()
+            if hasil is not None:
+                return hasil
+        return None
+
+    def terapkan(self, langkah):
+        if langkah["isi"] is not None:
+            self._isi(*langkah["isi"])
+        for i, d in langkah["hapus"]:
+            self.kand[i] &= ~(1 << d)
+            self.ada_eliminasi = True
+
+    def next_hint(self):
+        """
+        Petunjuk berikutnya: langkah yang mengisi satu sel. Eliminasi yang
+        dibutuhkan sebelumnya diterapkan ke grid kandidat (papan tidak diubah)
+        dan dicatat di "persiapan". Mengembalikan None jika tidak ada langkah logis.
+        """
+        if self.bentrok or self.buntu():
+            return None
+        persiapan = []
+        while True:
+            hasil = self.langkah()
+            if hasil is None:
+                return None
+            if hasil["isi"] is not None:
+                hasil["persiapan"] = persiapan
+                return hasil
+            self.terapkan(hasil)
+            persiapan.append(hasil)
+
+
+# --- 3. API ---
+
+def jelaskan(langkah):
+    """Kalimat penjelasan untuk sebuah langkah."""
+    nama = TEKNIK[langkah["teknik"]][0]
+    if langkah["isi"] is not None:
+        i, d = langkah["isi"]
+        if langkah["teknik"] == "hidden_single":
+            teks = f"{nama}: di {nama_kelompok(langkah['kelompok'])}, angka {d} hanya bisa di sel {nama_sel(i)}."
+        else:
+            teks = f"{nama}: sel {nama_sel(i)} hanya punya satu kandidat, yaitu {d}."
+    else:
+        sel = ", ".join(nama_sel(i) for i in langkah["sel"])
+        teks = f"{nama} di {nama_kelompok(langkah['kelompok'])} (sel {sel}) menghapus {len(langkah['hapus'])} kandidat."
+    persiapan = langkah.get("persiapan")
+    if persiapan:
+        teks = " ".join(jelaskan(p) for p in persiapan) + " Lalu " + teks[0].lower() + teks[1:]
+    return teks
+
+
+def grade_puzzle(board):
+    """
+    Menilai kesulitan soal dari teknik tersulit yang dibutuhkan jika selalu
+    memakai teknik termudah yang tersedia (lihat NAMA_TINGKAT).
+    """
+    grid = CandidateGrid(board)
+    tingkat = TINGKAT_NAKED_SINGLE
+    while not grid.selesai():
+        hasil = grid.langkah()
+        if hasil is None:
+            return TINGKAT_LANJUT
+        tingkat = max(tingkat, hasil["tingkat"])
+        grid.terapkan(hasil)
+    return tingkat
@@ -0,0 +1,92 @@
+"""
+Soal Sudoku yang bisa direproduksi dari seed, dan ID soal yang bisa dibagikan.
+
+ID soal menyimpan seed (32 bit) dan jumlah angka awal (7 bit) dalam bilangan
+base-36, misalnya "1J5Y8W0Q". Soal yang sama selalu dihasilkan dari ID yang
+sama, jadi server cukup menyimpan ID (misalnya di URL), bukan papannya.
+
+ID bersifat per-encoding (seed + jumlah angka awal), bukan per-soal: dua seed
+berbeda yang kebetulan menghasilkan papan yang sama, atau papan hasil
+rotasi/pencerminan/penukaran angka, mendapat ID berbeda. Yang dinormalkan
+hanya penulisan ID-nya (lihat canonical_puzzle_id): huruf besar/kecil, nol
+di depan, dan jumlah angka awal target vs hasil akhir carving.
+"""
+import secrets
+from functools import lru_cache
+
+import numpy as np
+
+from solver import UKURAN, carve_puzzle, generate_solution
+
+BIT_CLUES = 7
+MAKS_SEED = 1 << 32
+UKURAN_CACHE = 1024
+
+
+# --- 1. ID Soal ---
+
+def encode_puzzle_id(seed, clues):
+    if not 0 <= seed < MAKS_SEED or not 0 < clues <= UKURAN * UKURAN:
+        raise ValueError("Seed atau jumlah angka awal di luar rentang.")
+    return np.base_repr((seed << BIT_CLUES) | clues, 36)
+
+
+def decode_puzzle_id(puzzle_id):
+    """ID -> (seed, clues)."""
+    try:
+        kode = int(str(puzzle_id).strip(), 36)
+    except ValueError:
+        raise ValueError("ID soal tidak valid.") from None
+    seed, clues = kode >> BIT_CLUES, kode & ((1 << BIT_CLUES) - 1)
+    if not 0 <= seed < MAKS_SEED or not 0 < clues <= UKURAN * UKURAN:
+        raise ValueError("ID soal tidak valid.")
+    return seed, clues
+
+
+def new_seed():
+    return secrets.randbelow(MAKS_SEED)
+
+
+# --- 2. Pembuatan Soal Ber-seed ---
+
+def buat_soal(seed, clues):
+    """
+    Soal dan solusi untuk (seed, clues), tanpa cache. Karena carving berhenti
+    di titik yang sama, ID dengan jumlah angka awal hasil akhirnya (bukan
+    targetnya) menghasilkan soal yang sama persis.
+    """
+    rng = np.random.default_rng(seed)
+    solution = generate_solution(rng)
+    return carve_puzzle(solution, clues, rng), solution
+
+
+@lru_cache(maxsize=UKURAN_CACHE)
+def _buat_cache(seed, clues):
+    # Disimpan sebagai bytes agar isi cache tidak bisa diubah pemanggil
+    puzzle, solution = buat_soal(seed, clues)
+    return puzzle.astype(np.uint8).tobytes(), solution.astype(np.uint8).tobytes()
+
+
+def _papan(data):
+    return np.frombuffer(data, dtype=np.uint8).astype(int).reshape(UKURAN, UKURAN)
+
+
+def generate_puzzle(seed, clues):
+    """Soal dan solusi (array 9x9) untuk (seed, clues); hasil yang sering diminta diambil dari cache LRU."""
+    soal, solusi = _buat_cache(int(seed), int(clues))
+    return _papan(soal), _papan(solusi)
+
+
+def puzzle_from_id(puzzle_id):
+    return generate_puzzle(*decode_puzzle_id(puzzle_id))
+
+
+def canonical_puzzle_id(puzzle_id):
+    """
+    Bentuk baku sebuah ID: base-36 huruf besar tanpa nol di depan, dengan
+    jumlah angka awal hasil akhir carving. Semua penulisan yang menghasilkan
+    soal yang sama (dari seed yang sama) dipetakan ke ID yang sama.
+    """
+    seed, clues = decode_puzzle_id(puzzle_id)
+    soal, _ = generate_puzzle(seed, clues)
+    return encode_puzzle_id(seed, int(np.count_nonzero(soal)))
@@ -0,0 +1,485 @@
+from functools import lru_cache
+
+import numpy as np
+
+# --- 1. Tabel Bantu ---
+
+# Di atas ukuran ini jumlah kandidat dihitung langsung (tabel 2^(n+1) entri terlalu besar)
+UKURAN_TABEL = 16
+
+
+class Geometri:
+    """
+    Tabel bantu untuk papan berukuran (kotak^2) x (kotak^2): 4x4, 9x9, 16x16, 25x25, ...
+    Angka 1..ukuran disimpan sebagai bit 1..ukuran dalam sebuah bitmask.
+    """
+
+    def __init__(self, kotak):
+        if kotak < 2:
+            raise ValueError("Ukuran kotak minimal 2.")
+        n = kotak * kotak
+        self.kotak = kotak
+        self.ukuran = n
+        self.sel = n * n
+        self.semua = ((1 << n) - 1) << 1  # semua angka masih mungkin
+
+        # Untuk setiap indeks sel: baris, kolom, dan nomor kotaknya
+        self.baris = [i // n for i in range(self.sel)]
+        self.kolom = [i % n for i in range(self.sel)]
+        self.kotak_sel = [(r // kotak) * kotak + c // kotak for r, c in zip(self.baris, self.kolom)]
+        self.unit = list(zip(self.baris, self.kolom, self.kotak_sel))
+
+        # 3n kelompok (n baris, n kolom, n kotak), masing-masing berisi n indeks sel
+        self.kelompok = (
+            [[i for i in range(self.sel) if self.baris[i] == u] for u in range(n)]
+            + [[i for i in range(self.sel) if self.kolom[i] == u] for u in range(n)]
+            + [[i for i in range(self.sel) if self.kotak_sel[i] == u] for u in range(n)]
+        )
+
+        # Jumlah kandidat dan daftar angka untuk setiap bitmask
+        if n <= UKURAN_TABEL:
+            self.popcount = [bin(m).count("1") for m in range(1 << (n + 1))]
+            self.digit = [[d for d in range(1, n + 1) if m >> d & 1] for m in range(1 << (n + 1))]
+        else:
+            self.popcount = _Popcount()
+            self.digit = _Digit()
+
+
+class _Popcount:
+    """Pengganti tabel POPCOUNT untuk papan besar: popcount[mask]."""
+
+    def __getitem__(self, mask):
+        return mask.bit_count()
+
+
+class _Digit:
+    """Pengganti tabel DIGIT untuk papan besar: digit[mask] -> daftar angka."""
+
+    def __getitem__(self, mask):
+        digits = []
+        while mask:
+            bit = mask & -mask
+            digits.append(bit.bit_length() - 1)
+            mask ^= bit
+        return digits
+
+
+@lru_cache(maxsize=None)
+def geometri(kotak=3):
+    return Geometri(kotak)
+
+
+def geometri_papan(jumlah_sel):
+    """Geometri dari jumlah sel papan (16, 81, 256, 625, ...)."""
+    kotak = round(jumlah_sel ** 0.25)
+    if kotak < 2 or kotak ** 4 != jumlah_sel:
+        raise ValueError("Papan Sudoku harus berukuran N^2 x N^2 (4x4, 9x9, 16x16, ...).")
+    return geometri(kotak)
+
+
+# Papan standar 9x9
+_STANDAR = geometri(3)
+UKURAN = _STANDAR.ukuran
+KOTAK = _STANDAR.kotak
+SEMUA = _STANDAR.semua
+BARIS = _STANDAR.baris
+KOLOM = _STANDAR.kolom
+KOTAK_SEL = _STANDAR.kotak_sel
+UNIT = _STANDAR.unit
+KELOMPOK = _STANDAR.kelompok
+POPCOUNT = _STANDAR.popcount
+DIGIT = _STANDAR.digit
+
+
+# --- 2. Solver Bitmask ---
+
+class BatasNode(Exception):
+    """Pencarian dihentikan karena jumlah node melewati batas."""
+
+
+class BitmaskSolver:
+    """
+    Solver Sudoku dengan bitmask angka terpakai per baris, kolom, dan kotak.
+    Mengisi atau menghapus satu angka hanya mengubah tiga bitmask (O(1)),
+    dan pencarian selalu memilih sel dengan kandidat paling sedikit (MRV).
+    Tanpa `urutan`, setiap node lebih dulu mengisi naked/hidden single
+    (lihat _sebarkan) sehingga jauh lebih sedikit node yang bercabang.
+    Ukuran papan (4x4, 9x9, 16x16, ...) diambil dari jumlah selnya.
+    """
+
+    def __init__(self, board):
+        self.sel = [int(v) for v in np.asarray(board).reshape(-1)]
+        self.geo = geo = geometri_papan(len(self.sel))
+
+        self.baris = [0] * geo.ukuran
+        self.kolom = [0] * geo.ukuran
+        self.kotak = [0] * geo.ukuran
+        self.kosong = []
+        self.nodes = 0
+        self.batas_node = float("inf")
+        self.mask = [0] * geo.sel  # kandidat sel kosong (0 untuk sel terisi), dihitung ulang oleh _sebarkan
+        # Setiap kelompok beserta bitmask angka terpakainya (baris, kolom, atau kotak)
+        self.grup = [
+            (sel, terpakai, u % geo.ukuran)
+            for u, (sel, terpakai) in enumerate(zip(
+                geo.kelompok, [self.baris] * geo.ukuran + [self.kolom] * geo.ukuran + [self.kotak] * geo.ukuran
+            ))
+        ]
+
+        for i, d in enumerate(self.sel):
+            if d == 0:
+                self.kosong.append(i)
+            elif not 1 <= d <= geo.ukuran or not self.kandidat(i) >> d & 1:
+                raise ValueError("Papan awal melanggar aturan Sudoku.")
+            else:
+                self.isi(i, d)
+
+    def kandidat(self, i):
+        """Bitmask angka yang masih boleh diisi di sel i."""
+        r, c, b = self.geo.unit[i]
+        return self.geo.semua & ~(self.baris[r] | self.kolom[c] | self.kotak[b])
+
+    def isi(self, i, d):
+        bit = 1 << d
+        r, c, b = self.geo.unit[i]
+        self.baris[r] |= bit
+        self.kolom[c] |= bit
+        self.kotak[b] |= bit
+        self.sel[i] = d
+        self.mask[i] = 0
+
+    def hapus(self, i, d):
+        bit = ~(1 << d)
+        r, c, b = self.geo.unit[i]
+        self.baris[r] &= bit
+        self.kolom[c] &= bit
+        self.kotak[b] &= bit
+        self.sel[i] = 0
+
+    def _pilih_sel(self):
+        """MRV: posisi (di self.kosong) sel dengan kandidat paling sedikit, beserta bitmask-nya."""
+        baris, kolom, kotak = self.baris, self.kolom, self.kotak
+        unit, semua, popcount = self.geo.unit, self.geo.semua, self.geo.popcount
+        terbaik, mask_terbaik, jumlah_terbaik = -1, 0, self.geo.ukuran + 1
+        for k, i in enumerate(self.kosong):
+            r, c, b = unit[i]
+            mask = semua & ~(baris[r] | kolom[c] | kotak[b])
+            jumlah = popcount[mask]
+            if jumlah < jumlah_terbaik:
+                terbaik, mask_terbaik, jumlah_terbaik = k, mask, jumlah
+                if jumlah <= 1:
+                    break
+        return terbaik, mask_terbaik
+
+    def _sebarkan(self):
+        """
+        Mengisi naked single (sel dengan satu kandidat) dan hidden single (angka
+        yang hanya punya satu tempat di satu kelompok) berulang sampai tidak ada
+        lagi. self.kosong diganti daftar baru berisi sel yang masih kosong.
+        Mengembalikan (sel yang diisi, posisi MRV di self.kosong, mask MRV):
+        posisi -1 jika papan penuh, mask 0 jika buntu.
+        """
+        geo = self.geo
+        unit, semua, popcount = geo.unit, geo.semua, geo.popcount
+        baris, kolom, kotak, sel, mask = self.baris, self.kolom, self.kotak, self.sel, self.mask
+        diisi = []
+        while True:
+            # Naked single, sekaligus menghitung kandidat setiap sel kosong
+            kosong = []
+            ada_isi = False
+            for i in self.kosong:
+                if sel[i]:
+                    continue
+                r, c, b = unit[i]
+                m = semua & ~(baris[r] | kolom[c] | kotak[b])
+                if not m & (m - 1):
+                    if m == 0:
+                        return diisi, 0, 0
+                    baris[r] |= m
+                    kolom[c] |= m
+                    kotak[b] |= m
+                    sel[i] = m.bit_length() - 1
+                    mask[i] = 0
+                    diisi.append(i)
+                    ada_isi = True
+                else:
+                    mask[i] = m
+                    kosong.append(i)
+            self.kosong = kosong
+            if not kosong:
+                return diisi, -1, 0
+
+            # Hidden single: angka yang muncul di kandidat tepat satu sel kelompok.
+            # Kandidat yang usang (dihitung sebelum pengisian lain) hanya lebih
+            # longgar, jadi single yang ditemukan tetap benar setelah dicek ulang.
+            for sel_grup, terpakai, u in self.grup:
+                if terpakai[u] == semua:
+                    continue
+                satu = dua = 0
+                for i in sel_grup:
+                    m = mask[i]
+                    dua |= satu & m
+                    satu |= m
+                if (satu | terpakai[u]) != semua:
+                    return diisi, 0, 0  # ada angka yang tidak punya tempat
+                tunggal = satu & ~dua & ~terpakai[u]  # kandidat usang bisa berisi angka yang baru diisi
+                while tunggal:
+                    bit = tunggal & -tunggal
+                    tunggal ^= bit
+                    for i in sel_grup:
+                        if mask[i] & bit:
+                            break
+                    else:
+                        return diisi, 0, 0  # satu-satunya tempatnya baru diisi angka lain
+                    r, c, b = unit[i]
+                    if (baris[r] | kolom[c] | kotak[b]) & bit:
+                        return diisi, 0, 0
+                    baris[r] |= bit
+                    kolom[c] |= bit
+                    kotak[b] |= bit
+                    sel[i] = bit.bit_length() - 1
+                    mask[i] = 0
+                    diisi.append(i)
+                    ada_isi = True
+            if ada_isi:
+                continue
+
+            # Tidak ada single lagi (kandidat semuanya baru): MRV
+            terbaik, jumlah_terbaik = 0, geo.ukuran + 1
+            for k, i in enumerate(kosong):
+                jumlah = popcount[mask[i]]
+                if jumlah < jumlah_terbaik:
+                    terbaik, jumlah_terbaik = k, jumlah
+                    if jumlah == 2:
+                        break
+            return diisi, terbaik, mask[kosong[terbaik]]
+
+    def _batalkan(self, diisi, kosong):
+        """Mengosongkan kembali sel hasil _sebarkan dan memulihkan daftar kosong."""
+        for i in diisi:
+            self.hapus(i, self.sel[i])
+        self.kosong = kosong
+
+    def _cari_sebar(self):
+        self.nodes += 1
+        if self.nodes > self.batas_node:
+            raise BatasNode
+
+        kosong_awal = self.kosong
+        diisi, k, mask = self._sebarkan()
+        if k < 0:
+            return True
+        if mask == 0:
+            self._batalkan(diisi, kosong_awal)
+            return False
+
+        # Sel cabang dikeluarkan dari daftar kosong milik node ini
+        kosong = self.kosong
+        i = kosong[k]
+        kosong[k] = kosong[-1]
+        kosong.pop()
+        for d in self.geo.digit[mask]:
+            self.isi(i, d)
+            if self._cari_sebar():
+                return True
+            self.hapus(i, d)
+            self.kosong = kosong
+
+        self._batalkan(diisi, kosong_awal)
+        return False
+
+    def _cari(self, urutan):
+        kosong = self.kosong
+        if not kosong:
+            return True
+        self.nodes += 1
+        if self.nodes > self.batas_node:
+            raise BatasNode
+
+        k, mask = self._pilih_sel()
+        if mask == 0:
+            return False
+
+        # Keluarkan sel terpilih dari daftar kosong (tukar dengan elemen terakhir)
+        i = kosong[k]
+        kosong[k] = kosong[-1]
+        kosong.pop()
+
+        if urutan is None:
+            digits = self.geo.digit[mask]
+        else:
+            digits = [d for d in urutan[i] if mask >> d & 1]
+        for d in digits:
+            self.isi(i, d)
+            if self._cari(urutan):
+                return True
+            self.hapus(i, d)
+
+        # Kembalikan urutan daftar kosong seperti semula
+        kosong.append(i)
+        kosong[k], kosong[-1] = kosong[-1], kosong[k]
+        return False
+
+    def solve(self, urutan=None, batas_node=None):
+        """
+        Menyelesaikan papan di tempat. `urutan[i]` (opsional) adalah urutan
+        angka yang dicoba di sel i; dipakai untuk membuat papan acak.
+        Jika `batas_node` diisi dan terlampaui, BatasNode dilempar dan isi
+        papan tidak lagi bisa dipakai.
+        """
+        self.batas_node = float("inf") if batas_node is None else self.nodes + batas_node
+        try:
+            # Dengan `urutan` (papan acak ber-seed) pencarian tetap MRV murni,
+            # supaya seed yang sama selalu menghasilkan papan yang sama
+            return self._cari_sebar() if urutan is None else self._cari(urutan)
+        finally:
+            self.batas_node = float("inf")
+
+    def _hitung(self, batas):
+        self.nodes += 1
+        if self.nodes > self.batas_node:
+            raise BatasNode
+
+        kosong_awal = self.kosong
+        diisi, k, mask = self._sebarkan()
+        if k < 0 or mask == 0:
+            self._batalkan(diisi, kosong_awal)
+            return 1 if k < 0 else 0
+
+        kosong = self.kosong
+        i = kosong[k]
+        kosong[k] = kosong[-1]
+        kosong.pop()
+
+        total = 0
+        for d in self.geo.digit[mask]:
+            self.isi(i, d)
+            total += self._hitung(batas - total)
+            self.hapus(i, d)
+            self.kosong = kosong
+            if total >= batas:
+                break
+
+        self._batalkan(diisi, kosong_awal)
+        return total
+
+    def count_solutions(self, batas=2, batas_node=None):
+        """
+        Menghitung jumlah solusi, berhenti begitu mencapai `batas`.
+        Dengan batas=2 cukup untuk mengetahui apakah solusinya tunggal.
+        Papan dikembalikan ke keadaan semula setelah dihitung, juga jika
+        BatasNode dilempar karena `batas_node` terlampaui.
+        """
+        if batas_node is None:
+            return self._hitung(batas)
+
+        simpan = (self.sel[:], self.baris[:], self.kolom[:], self.kotak[:], self.kosong[:])
+        self.batas_node = self.nodes + batas_node
+        try:
+            return self._hitung(batas)
+        except BatasNode:
+            # Isi list dipulihkan di tempat: self.grup memegang referensi ke baris/kolom/kotak
+            self.sel[:], self.baris[:], self.kolom[:], self.kotak[:], self.kosong = simpan
+            raise
+        finally:
+            self.batas_node = float("inf")
+
+    def kosongkan(self, i):
+        """Menghapus angka di sel i dan menjadikannya sel kosong."""
+        self.hapus(i, self.sel[i])
+        self.kosong.append(i)
+
+    def board(self):
+        n = self.geo.ukuran
+        return np.array(self.sel, dtype=int).reshape(n, n)
+
+
+# --- 3. API ---
+
+BATAS_NODE_PER_SEL = 2  # batas node awal per sel untuk satu percobaan generate_solution
+BATAS_NODE_UNIK = 1     # batas node per sel untuk satu pemeriksaan keunikan saat carving
+
+def urutan_acak(rng=None, kotak=KOTAK):
+    """Urutan coba angka 1..n yang diacak untuk setiap sel (satu panggilan NumPy)."""
+    rng = np.random.default_rng(rng)
+    geo = geometri(kotak)
+    return (rng.random((geo.sel, geo.ukuran)).argsort(axis=1) + 1).tolist()
+
+
+def solve(board, urutan=None):
+    """Mengembalikan solusi papan (array n x n), atau None jika tidak ada solusi."""
+    solver = BitmaskSolver(board)
+    if not solver.solve(urutan):
+        return None
+    return solver.board()
+
+
+def count_solutions(board, batas=2):
+    """Jumlah solusi papan (maksimal `batas`)."""
+    return BitmaskSolver(board).count_solutions(batas)
+
+
+def carve_puzzle(solution, clues, rng=None):
+    """
+    Membuat soal dari papan penuh dengan mengosongkan sel dalam urutan acak.
+    Sel hanya dikosongkan jika soal tetap memiliki tepat satu solusi, jadi
+    jika `clues` terlalu sedikit hasilnya bisa berisi lebih banyak angka.
+    `rng` boleh berupa seed atau numpy.random.Generator.
+
+    Pada papan di atas 9x9 pemeriksaan keunikan bisa sangat lama; jika melewati
+    BATAS_NODE_UNIK node per sel, angka tersebut dianggap perlu dan dikembalikan.
+    """
+    rng = np.random.default_rng(rng)
+    solver = BitmaskSolver(solution)
+    terisi = solver.geo.sel
+    batas_node = None if solver.geo.ukuran <= UKURAN else BATAS_NODE_UNIK * solver.geo.sel
+    for i in rng.permutation(solver.geo.sel).tolist():
+        if terisi <= clues:
+            break
+        d = solver.sel[i]
+        solver.kosongkan(i)
+        try:
+            unik = solver.count_solutions(2, batas_node) == 1
+        except BatasNode:
+            unik = False
+        if unik:
+            terisi -= 1
+        else:
+            # Solusi tidak lagi tunggal (atau tidak terbukti tunggal): kembalikan angkanya
+            solver.kosong.pop()
+            solver.isi(i, d)
+    return solver.board()
+
+
+def _diagonal_acak(rng, kotak):
+    """Papan kosong dengan kotak-kotak diagonal diisi permutasi acak."""
+    n = kotak * kotak
+    board = np.zeros((n, n), dtype=int)
+    acak = rng.random((kotak, n)).argsort(axis=1) + 1
+    for k in range(kotak):
+        board[k * kotak:(k + 1) * kotak, k * kotak:(k + 1) * kotak] = acak[k].reshape(kotak, kotak)
+    return board
+
+
+def generate_solution(rng=None, kotak=KOTAK):
+    """Membuat papan Sudoku penuh yang valid secara acak (`rng`: seed atau Generator)."""
+    rng = np.random.default_rng(rng)
+
+    # Kotak-kotak diagonal tidak saling membatasi, jadi bisa langsung diisi
+    # permutasi acak; solver cukup melengkapi sisa selnya
+    board = _diagonal_acak(rng, kotak)
+
+    # Waktu backtracking dengan urutan acak berekor panjang (terutama 25x25):
+    # jika satu percobaan terlalu lama, ulangi dengan urutan acak baru
+    # Papan 9x9 ke bawah tidak dibatasi, supaya seed yang sama tetap
+    # menghasilkan papan yang sama seperti sebelum ada batas node (ID soal)
+    batas = None if kotak <= KOTAK else BATAS_NODE_PER_SEL * board.size
+    while True:
+        solver = BitmaskSolver(board)
+        try:
+            if solver.solve(urutan_acak(rng, kotak), batas):
+                return solver.board()
+            # Hanya terjadi pada 4x4: isi kotak diagonal bisa membuat papan tanpa solusi
+            board = _diagonal_acak(rng, kotak)
+        except BatasNode:
+            batas = batas * 3 // 2
@@ -0,0 +1,46 @@
+"""
+Seed -> papan 9x9 harus tetap sama antar versi: ID soal yang sudah dibagikan
+(URL ?id=) dan record bank menyimpan seed, bukan papannya.
+
+Nilai di bawah dibuat dari versi sebelum generate_solution memakai batas node;
+seed 3554, 3633 dan 3700 adalah seed yang melewati batas tersebut.
+"""
+import numpy as np
+import pytest
+
+from puzzle_id import buat_soal, encode_puzzle_id, puzzle_from_id
+
+SOAL_TERKUNCI = {
+    0: (
+        "030605090000000560050010034100350080080062003200400000008700001609540007300000600",
+        "432675198971834562856219734194357286785962413263481975528796341619543827347128659",
+    ),
+    3554: (
+        "910005003030700600005023000560040030021000509300500010098070001000010007100200900",
+        "916485273832791645745623198567149832421837569389562714298376451654918327173254986",
+    ),
+    3633: (
+        "000503200700000000030970060050702080007000429000160500008690003000050010005308602",
+        "496583271781426395532971864359742186167835429824169537218694753643257918975318642",
+    ),
+    3700: (
+        "600251300051080007000000090000008013400076509010020400000862000000040900020019050",
+        "697251384351984267842637195275498613483176529916523478539862741168745932724319856",
+    ),
+}
+
+
+def _teks(papan):
+    return "".join(map(str, np.asarray(papan).ravel()))
+
+
+@pytest.mark.parametrize("seed", sorted(SOAL_TERKUNCI))
+def test_seed_menghasilkan_papan_yang_sama(seed):
+    soal, solusi = buat_soal(seed, 30)
+    assert (_teks(soal), _teks(solusi)) == SOAL_TERKUNCI[seed]
+
+
+def test_id_9r1a_tetap_seed_3554():
+    soal, solusi = puzzle_from_id("9R1A")
+    assert encode_puzzle_id(3554, int(np.count_nonzero(soal))) == "9R1A"
+    assert _teks(solusi) == SOAL_TERKUNCI[3554][1]
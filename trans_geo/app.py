@@ -2,52 +2,32 @@ import streamlit as st
 import numpy as np
 import matplotlib.pyplot as plt
 
-# --- 1. Fungsi Transformasi ---
-
-def translasi(titik, vektor_t):
-    """Melakukan translasi titik. Titik dan Vektor_T adalah array [x, y]"""
-    return titik + vektor_t
-
-def rotasi(titik, sudut_deg, pusat=np.array([0, 0])):
-    """Melakukan rotasi titik terhadap pusat (default 0,0)"""
-    sudut_rad = np.deg2rad(sudut_deg)
-    matriks_rotasi = np.array([
-        [np.cos(sudut_rad), -np.sin(sudut_rad)],
-        [np.sin(sudut_rad), np.cos(sudut_rad)]
-    ])
-    
-    # Translasi titik ke pusat (jika pusat bukan [0,0]), rotasi, lalu translasi kembali
-    titik_pusat = titik - pusat
-    titik_baru_pusat = np.dot(matriks_rotasi, titik_pusat.T).T
-    titik_baru = titik_baru_pusat + pusat
-    return titik_baru
-
-def refleksi(titik, sumbu):
-    """Melakukan refleksi titik terhadap sumbu x, y, atau garis y=x, y=-x"""
-    x, y = titik
-    if sumbu == 'sumbu X':
-        return np.array([x, -y])
-    elif sumbu == 'sumbu Y':
-        return np.array([-x, y])
-    elif sumbu == 'y = x':
-        return np.array([y, x])
-    elif sumbu == 'y = -x':
-        return np.array([-y, -x])
-    else:
-        return titik
+from transformasi import (
+    SUMBU_REFLEKSI, komposisi, matriks_dilatasi, matriks_refleksi,
+    matriks_rotasi, matriks_translasi, terapkan,
+)
 
-def dilatasi(titik, faktor_skala, pusat=np.array([0, 0])):
-    """Melakukan dilatasi titik terhadap pusat (default 0,0)"""
-    # Translasi titik ke pusat, dilatasi, lalu translasi kembali
-    titik_pusat = titik - pusat
-    titik_baru_pusat = titik_pusat * faktor_skala
-    titik_baru = titik_baru_pusat + pusat
-    return titik_baru
+# --- 1. Objek Awal ---
+# Fungsi transformasi (matriks homogen 3x3) ada di transformasi.py
+
+OBJEK = ['Titik', 'Segitiga', 'Persegi', 'Awan Titik']
+MAKS_TITIK_PLOT = 5_000  # awan titik besar hanya digambar sebagian
+
+def buat_objek(objek, titik_awal, jumlah_titik=10_000, seed=0):
+    """Titik-titik objek sebagai array (2,) atau (N, 2), berjangkar di titik A"""
+    if objek == 'Titik':
+        return titik_awal.astype(float)
+    if objek == 'Segitiga':
+        return titik_awal + np.array([[0, 0], [3, 0], [0, 2]], dtype=float)
+    if objek == 'Persegi':
+        return titik_awal + np.array([[0, 0], [2, 0], [2, 2], [0, 2]], dtype=float)
+    rng = np.random.default_rng(seed)
+    return titik_awal + rng.normal(0, 1, (jumlah_titik, 2))
 
 # --- 2. Fungsi Plotting ---
 
 def plot_transformasi(titik_awal, titik_akhir, judul):
-    """Membuat plot visualisasi transformasi"""
+    """Membuat plot visualisasi transformasi (satu titik, poligon, atau awan titik)"""
     fig, ax = plt.subplots(figsize=(6, 6))
     
     # Pastikan batasan plot cukup besar
@@ -64,19 +44,77 @@ def plot_transformasi(titik_awal, titik_akhir, judul):
     ax.grid(color='lightgray', linestyle='--', linewidth=0.5)
     ax.set_aspect('equal', adjustable='box')
     
-    # Plot titik awal (merah)
-    ax.plot(titik_awal[0], titik_awal[1], 'ro', label='Titik Awal')
-    # Plot titik akhir (biru)
-    ax.plot(titik_akhir[0], titik_akhir[1], 'bo', label='Titik Akhir')
-    
-    # Beri label koordinat
-    ax.text(titik_awal[0], titik_awal[1] + 0.5, f'A({titik_awal[0]}, {titik_awal[1]})', color='red')
-    ax.text(titik_akhir[0], titik_akhir[1] + 0.5, f'A\'({titik_akhir[0]}, {titik_akhir[1]})', color='blue')
+    if titik_awal.ndim == 1:
+        # Plot titik awal (merah)
+        ax.plot(titik_awal[0], titik_awal[1], 'ro', label='Titik Awal')
+        # Plot titik akhir (biru)
+        ax.plot(titik_akhir[0], titik_akhir[1], 'bo', label='Titik Akhir')
+        
+        # Beri label koordinat
+        ax.text(titik_awal[0], titik_awal[1] + 0.5, f'A({titik_awal[0]:g}, {titik_awal[1]:g})', color='red')
+        ax.text(titik_akhir[0], titik_akhir[1] + 0.5, f'A\'({titik_akhir[0]:.2f}, {titik_akhir[1]:.2f})', color='blue')
+    elif len(titik_awal) <= 10:
+        # Poligon: sudut-sudutnya dihubungkan kembali ke titik pertama
+        ax.fill(titik_awal[:, 0], titik_awal[:, 1], facecolor='red', alpha=0.2, edgecolor='red', label='Bangun Awal')
+        ax.fill(titik_akhir[:, 0], titik_akhir[:, 1], facecolor='blue', alpha=0.2, edgecolor='blue', label='Bangun Akhir')
+        ax.plot(*titik_awal[0], 'ro')
+        ax.plot(*titik_akhir[0], 'bo')
+        ax.text(titik_awal[0, 0], titik_awal[0, 1] + 0.5, 'A', color='red')
+        ax.text(titik_akhir[0, 0], titik_akhir[0, 1] + 0.5, 'A\'', color='blue')
+    else:
+        # Awan titik: hanya sebagian yang digambar
+        ax.scatter(*titik_awal[:MAKS_TITIK_PLOT].T, s=1, color='red', alpha=0.3, label='Titik Awal')
+        ax.scatter(*titik_akhir[:MAKS_TITIK_PLOT].T, s=1, color='blue', alpha=0.3, label='Titik Akhir')
     
     ax.set_title(judul)
     ax.legend()
     st.pyplot(fig)
 
+def parameter_transformasi(operasi, kunci=""):
+    """
+    Widget parameter satu transformasi di sidebar.
+    Mengembalikan (matriks homogen 3x3, keterangan judul, rumus).
+    """
+    st.sidebar.markdown("---")
+    if operasi == 'Translasi':
+        st.sidebar.subheader("Parameter Translasi (Vektor T)")
+        tx = st.sidebar.slider("Pergeseran X (Tx)", -10, 10, 2, key=f"tx{kunci}")
+        ty = st.sidebar.slider("Pergeseran Y (Ty)", -10, 10, -1, key=f"ty{kunci}")
+        return (matriks_translasi(tx, ty), f"$T = ({tx}, {ty})$",
+                "Rumus: $A'(x', y') = A(x+T_x, y+T_y)$")
+
+    if operasi == 'Rotasi':
+        st.sidebar.subheader("Parameter Rotasi")
+        sudut = st.sidebar.slider("Sudut Rotasi (derajat)", -360, 360, 90, 5, key=f"sudut{kunci}")
+        pusat_x = st.sidebar.number_input("Pusat Rotasi X", value=0, step=1, key=f"rot_x{kunci}")
+        pusat_y = st.sidebar.number_input("Pusat Rotasi Y", value=0, step=1, key=f"rot_y{kunci}")
+        return (matriks_rotasi(sudut, (pusat_x, pusat_y)), f"{sudut}° terhadap Pusat $P({pusat_x}, {pusat_y})$",
+                "Rotasi menggunakan matriks: Matriks Rotasi $\\times$ Titik")
+
+    if operasi == 'Refleksi':
+        st.sidebar.subheader("Parameter Refleksi")
+        sumbu_refleksi = st.sidebar.selectbox("Pilih Sumbu/Garis Refleksi", SUMBU_REFLEKSI, key=f"sumbu{kunci}")
+        rumus = {
+            'sumbu X': "$A'(x', y') = A(x, -y)$",
+            'sumbu Y': "$A'(x', y') = A(-x, y)$",
+            'y = x': "$A'(x', y') = A(y, x)$",
+            'y = -x': "$A'(x', y') = A(-y, -x)$",
+        }[sumbu_refleksi]
+        return matriks_refleksi(sumbu_refleksi), f"Terhadap Garis: {sumbu_refleksi}", f"Rumus: {rumus}"
+
+    # Dilatasi
+    st.sidebar.subheader("Parameter Dilatasi")
+    faktor_k = st.sidebar.slider("Faktor Skala (k)", -3.0, 3.0, 1.5, 0.1, key=f"k{kunci}")
+    pusat_x = st.sidebar.number_input("Pusat Dilatasi X", value=0, step=1, key=f"dil_x{kunci}")
+    pusat_y = st.sidebar.number_input("Pusat Dilatasi Y", value=0, step=1, key=f"dil_y{kunci}")
+    return (matriks_dilatasi(faktor_k, (pusat_x, pusat_y)), f"$k = {faktor_k}$ terhadap Pusat $P({pusat_x}, {pusat_y})$",
+            "Rumus terhadap $P(0,0)$: $A'(x', y') = A(kx, ky)$")
+
+def latex_matriks(m):
+    """Matriks 3x3 sebagai LaTeX bmatrix"""
+    baris = [" & ".join(f"{v:.3g}" for v in (0.0 if abs(v) < 1e-12 else v for v in r)) for r in m]
+    return r"\begin{bmatrix}" + r" \\ ".join(baris) + r"\end{bmatrix}"
+
 # --- 3. UI Streamlit ---
 
 st.set_page_config(page_title="Virtual Lab Transformasi Geometri", layout="wide")
@@ -92,84 +130,70 @@ x_awal = st.sidebar.number_input("Koordinat X:", value=2, step=1)
 y_awal = st.sidebar.number_input("Koordinat Y:", value=3, step=1)
 titik_awal = np.array([x_awal, y_awal])
 
+# Pilih Objek: satu titik, poligon berjangkar di A, atau awan titik di sekitar A
+objek = st.sidebar.selectbox("Objek", OBJEK)
+jumlah_titik = 0
+if objek == 'Awan Titik':
+    jumlah_titik = st.sidebar.select_slider(
+        "Jumlah Titik", options=[1_000, 10_000, 100_000, 1_000_000], value=10_000,
+        format_func=lambda n: f"{n:,}",
+    )
+objek_awal = buat_objek(objek, titik_awal, jumlah_titik)
+
 # Pilih Jenis Transformasi
 operasi = st.sidebar.selectbox(
     "Pilih Jenis Transformasi",
-    ['Translasi', 'Rotasi', 'Refleksi', 'Dilatasi']
+    ['Translasi', 'Rotasi', 'Refleksi', 'Dilatasi', 'Komposisi']
 )
 
-# Inisialisasi titik_akhir
-titik_akhir = titik_awal
 judul_plot = f"Visualisasi Transformasi: {operasi}"
 
 # Logika Kontrol Berdasarkan Pilihan
-if operasi == 'Translasi':
-    st.sidebar.markdown("---")
-    st.sidebar.subheader("Parameter Translasi (Vektor T)")
-    tx = st.sidebar.slider("Pergeseran X (Tx)", -10, 10, 2)
-    ty = st.sidebar.slider("Pergeseran Y (Ty)", -10, 10, -1)
-    vektor_t = np.array([tx, ty])
-    titik_akhir = translasi(titik_awal, vektor_t)
-    judul_plot += f"\n$T = ({tx}, {ty})$"
-    st.sidebar.info(f"Rumus: $A'(x', y') = A(x+T_x, y+T_y)$")
-
-elif operasi == 'Rotasi':
-    st.sidebar.markdown("---")
-    st.sidebar.subheader("Parameter Rotasi")
-    sudut = st.sidebar.slider("Sudut Rotasi (derajat)", -360, 360, 90, 5)
-    pusat_x = st.sidebar.number_input("Pusat Rotasi X", value=0, step=1)
-    pusat_y = st.sidebar.number_input("Pusat Rotasi Y", value=0, step=1)
-    pusat = np.array([pusat_x, pusat_y])
-    titik_akhir = rotasi(titik_awal, sudut, pusat)
-    judul_plot += f"\n{sudut}° terhadap Pusat $P({pusat_x}, {pusat_y})$"
-    st.sidebar.info(f"Rotasi menggunakan matriks: Matriks Rotasi $\\times$ Titik")
-
-elif operasi == 'Refleksi':
-    st.sidebar.markdown("---")
-    st.sidebar.subheader("Parameter Refleksi")
-    sumbu_refleksi = st.sidebar.selectbox(
-        "Pilih Sumbu/Garis Refleksi",
-        ['sumbu X', 'sumbu Y', 'y = x', 'y = -x']
-    )
-    titik_akhir = refleksi(titik_awal, sumbu_refleksi)
-    judul_plot += f"\nTerhadap Garis: {sumbu_refleksi}"
-    
-    rumus = ""
-    if sumbu_refleksi == 'sumbu X':
-        rumus = "$A'(x', y') = A(x, -y)$"
-    elif sumbu_refleksi == 'sumbu Y':
-        rumus = "$A'(x', y') = A(-x, y)$"
-    elif sumbu_refleksi == 'y = x':
-        rumus = "$A'(x', y') = A(y, x)$"
-    elif sumbu_refleksi == 'y = -x':
-        rumus = "$A'(x', y') = A(-y, -x)$"
-    st.sidebar.info(f"Rumus: {rumus}")
-
-
-elif operasi == 'Dilatasi':
-    st.sidebar.markdown("---")
-    st.sidebar.subheader("Parameter Dilatasi")
-    faktor_k = st.sidebar.slider("Faktor Skala (k)", -3.0, 3.0, 1.5, 0.1)
-    pusat_x = st.sidebar.number_input("Pusat Dilatasi X", value=0, step=1)
-    pusat_y = st.sidebar.number_input("Pusat Dilatasi Y", value=0, step=1)
-    pusat = np.array([pusat_x, pusat_y])
-    titik_akhir = dilatasi(titik_awal, faktor_k, pusat)
-    judul_plot += f"\n$k = {faktor_k}$ terhadap Pusat $P({pusat_x}, {pusat_y})$"
-    st.sidebar.info(f"Rumus terhadap $P(0,0)$: $A'(x', y') = A(kx, ky)$")
+if operasi == 'Komposisi':
+    # Rangkaian transformasi digabung menjadi satu matriks sebelum diterapkan
+    jumlah_langkah = st.sidebar.slider("Jumlah Langkah", 2, 4, 2)
+    daftar_matriks = []
+    urutan = []
+    for i in range(jumlah_langkah):
+        langkah = st.sidebar.selectbox(
+            f"Langkah {i + 1}", ['Translasi', 'Rotasi', 'Refleksi', 'Dilatasi'], index=i % 4, key=f"langkah{i}"
+        )
+        matriks_langkah, _, _ = parameter_transformasi(langkah, kunci=f"_{i}")
+        daftar_matriks.append(matriks_langkah)
+        urutan.append(langkah)
+    matriks = komposisi(*daftar_matriks)
+    judul_plot += "\n" + " → ".join(urutan)
+    st.sidebar.info("Matriks gabungan: $M = M_n \\times \\dots \\times M_2 \\times M_1$")
+else:
+    matriks, keterangan, rumus = parameter_transformasi(operasi)
+    judul_plot += f"\n{keterangan}"
+    st.sidebar.info(rumus)
+
+objek_akhir = terapkan(matriks, objek_awal)
 
 # --- 4. Tampilkan Hasil ---
 
 col1, col2 = st.columns([2, 1])
 
 with col1:
-    plot_transformasi(titik_awal, titik_akhir, judul_plot)
+    plot_transformasi(objek_awal, objek_akhir, judul_plot)
+    if jumlah_titik > MAKS_TITIK_PLOT:
+        st.caption(f"{jumlah_titik:,} titik ditransformasikan; {MAKS_TITIK_PLOT:,} titik pertama yang digambar.")
     
 
 with col2:
     st.subheader("📝 Hasil Perhitungan")
+    titik_akhir = objek_akhir if objek == 'Titik' else objek_akhir[0]
     st.markdown(f"**Titik Awal $A$:** $({titik_awal[0]}, {titik_awal[1]})$")
     st.markdown(f"**Transformasi:** **{operasi}**")
     st.markdown(f"**Titik Akhir $A'$:** $({titik_akhir[0]:.2f}, {titik_akhir[1]:.2f})$")
+    st.markdown("**Matriks Homogen $M$:**")
+    st.latex(latex_matriks(matriks))
+    if objek in ('Segitiga', 'Persegi'):
+        st.dataframe(
+            {"x": objek_awal[:, 0], "y": objek_awal[:, 1], "x'": objek_akhir[:, 0].round(2), "y'": objek_akhir[:, 1].round(2)},
+            use_container_width=True,
+        )
 
     st.markdown("---")
     st.subheader("💡 Konsep Dasar")
@@ -181,6 +205,8 @@ with col2:
         st.write("Refleksi (pencerminan) adalah transformasi yang memindahkan setiap titik pada bidang datar ke bayangan cerminnya.")
     elif operasi == 'Dilatasi':
         st.write("Dilatasi (perkalian) adalah transformasi yang mengubah ukuran, memperbesar atau memperkecil, suatu bangun tetapi tidak mengubah bentuknya.")
+    elif operasi == 'Komposisi':
+        st.write("Komposisi transformasi adalah beberapa transformasi yang dilakukan berurutan. Dengan koordinat homogen, hasilnya sama dengan satu matriks hasil perkalian matriks-matriks setiap langkah.")
 
 st.markdown("---")
 st.caption("Dibuat dengan Python dan Streamlit. Siswa dapat mencoba berbagai input untuk memvisualisasikan bagaimana koordinat berubah.")
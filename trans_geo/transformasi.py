@@ -0,0 +1,103 @@
+"""
+Mesin transformasi geometri dengan matriks homogen 3x3.
+
+Setiap transformasi adalah matriks M sehingga [x', y', 1] = M @ [x, y, 1].
+Titik disimpan sebagai array (N, 2) (atau satu titik (2,)), jadi poligon
+atau awan titik berisi jutaan titik diubah sekaligus dengan satu perkalian
+matriks. Rangkaian transformasi digabung dulu menjadi satu matriks
+(komposisi) lalu diterapkan sekali.
+"""
+import numpy as np
+
+SUMBU_REFLEKSI = ['sumbu X', 'sumbu Y', 'y = x', 'y = -x']
+
+_MATRIKS_REFLEKSI = {
+    'sumbu X': [[1, 0], [0, -1]],
+    'sumbu Y': [[-1, 0], [0, 1]],
+    'y = x': [[0, 1], [1, 0]],
+    'y = -x': [[0, -1], [-1, 0]],
+}
+
+
+# --- 1. Matriks Transformasi ---
+
+def matriks_linear(a, b=(0, 0)):
+    """Matriks homogen dari bagian linear 2x2 `a` dan pergeseran `b`."""
+    m = np.eye(3)
+    m[:2, :2] = a
+    m[:2, 2] = b
+    return m
+
+
+def _terhadap_pusat(a, pusat):
+    """Bagian linear `a` yang bekerja terhadap titik pusat: T(p) . A . T(-p)."""
+    pusat = np.asarray(pusat, dtype=float)
+    a = np.asarray(a, dtype=float)
+    return matriks_linear(a, pusat - a @ pusat)
+
+
+def matriks_translasi(tx, ty):
+    return matriks_linear(np.eye(2), (tx, ty))
+
+
+def matriks_rotasi(sudut_deg, pusat=(0, 0)):
+    sudut_rad = np.deg2rad(sudut_deg)
+    c, s = np.cos(sudut_rad), np.sin(sudut_rad)
+    return _terhadap_pusat([[c, -s], [s, c]], pusat)
+
+
+def matriks_refleksi(sumbu):
+    if sumbu not in _MATRIKS_REFLEKSI:
+        raise ValueError(f"Sumbu refleksi tidak dikenal: {sumbu}")
+    return matriks_linear(_MATRIKS_REFLEKSI[sumbu])
+
+
+def matriks_dilatasi(faktor_skala, pusat=(0, 0)):
+    return _terhadap_pusat(faktor_skala * np.eye(2), pusat)
+
+
+def komposisi(*matriks):
+    """
+    Satu matriks untuk rangkaian transformasi, diterapkan berurutan dari
+    kiri ke kanan: komposisi(A, B) berarti A dulu, lalu B (= B @ A).
+    """
+    hasil = np.eye(3)
+    for m in matriks:
+        hasil = m @ hasil
+    return hasil
+
+
+# --- 2. Menerapkan Matriks ---
+
+def terapkan(matriks, titik):
+    """
+    Menerapkan matriks homogen ke titik (2,) atau (N, 2).
+    Sama dengan [titik, 1] @ M.T, tetapi tanpa membuat salinan (N, 3):
+    bagian linear lewat satu matmul, lalu ditambah pergeseran.
+    """
+    titik = np.asarray(titik, dtype=float)
+    if titik.shape[-1] != 2:
+        raise ValueError("Titik harus berbentuk (2,) atau (N, 2).")
+    return titik @ matriks[:2, :2].T + matriks[:2, 2]
+
+
+# --- 3. Transformasi Dasar (satu titik atau banyak titik) ---
+
+def translasi(titik, vektor_t):
+    """Translasi titik (2,) atau (N, 2) sejauh vektor [Tx, Ty]."""
+    return terapkan(matriks_translasi(*vektor_t), titik)
+
+
+def rotasi(titik, sudut_deg, pusat=(0, 0)):
+    """Rotasi titik terhadap pusat (default 0,0)."""
+    return terapkan(matriks_rotasi(sudut_deg, pusat), titik)
+
+
+def refleksi(titik, sumbu):
+    """Refleksi titik terhadap sumbu X, sumbu Y, atau garis y=x, y=-x."""
+    return terapkan(matriks_refleksi(sumbu), titik)
+
+
+def dilatasi(titik, faktor_skala, pusat=(0, 0)):
+    """Dilatasi titik dengan faktor k terhadap pusat (default 0,0)."""
+    return terapkan(matriks_dilatasi(faktor_skala, pusat), titik)